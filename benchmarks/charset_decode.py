@@ -0,0 +1,61 @@
+"""
+한글(CP949) 게시판 페이지의 디코딩 시간 비교 벤치마크
+
+- bs4(bytes): 기존 방식, BeautifulSoup에 res.content를 그대로 넘겨 매번 인코딩 감지
+- resolver(first): charset_resolver 첫 요청 (meta/헤더가 없으면 자동 감지 후 호스트별 캐시)
+- resolver(cached): 캐시된 인코딩으로 바로 디코딩 (이후 실행)
+
+실행: python -m benchmarks.charset_decode
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import UnicodeDammit
+
+import src.charset_resolver as charset_resolver
+
+ITERATIONS = 50
+URL = "https://bench.example.ac.kr/board/list"
+
+def make_page(with_meta):
+    meta = '<meta http-equiv="Content-Type" content="text/html; charset=euc-kr">' if with_meta else ""
+    rows = "".join(
+        f"<tr><td class='title'>2025학년도 {i}차 국가장학금 신청 안내 및 교내 장학생 선발 공고</td>"
+        f"<td>학생지원팀</td><td>2025-03-{i % 28 + 1:02d}</td></tr>"
+        for i in range(60)
+    )
+    return f"<html><head>{meta}<title>공지사항</title></head><body><table>{rows}</table></body></html>".encode('cp949')
+
+def bench(label, func, content):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        text = func(content)
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1000
+    garbled = "장학금" not in text
+    print(f"{label:<20} {elapsed:8.3f} ms/page {'(깨짐)' if garbled else ''}")
+    return elapsed
+
+def main():
+    # 실제 캐시 파일을 건드리지 않도록 임시 경로 사용
+    charset_resolver.CHARSET_CACHE_PATH = os.path.join(tempfile.mkdtemp(), "charset.json")
+
+    for with_meta in (False, True):
+        content = make_page(with_meta)
+        print(f"\n[{'meta 있음' if with_meta else 'meta 없음'}] {len(content) / 1024:.1f}KB, {ITERATIONS}회 평균")
+        baseline = bench("bs4(bytes)", lambda c: UnicodeDammit(c, is_html=True).unicode_markup, content)
+
+        def first(c):
+            charset_resolver._charset_cache = {}
+            return charset_resolver.decode_content(c, URL)
+        bench("resolver(first)", first, content)
+
+        charset_resolver.decode_content(content, URL)
+        cached = bench("resolver(cached)", lambda c: charset_resolver.decode_content(c, URL), content)
+        print(f"{'절감':<20} {baseline - cached:8.3f} ms/page ({baseline / cached:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+bs4 파싱·추출 처리량 벤치마크 (메인 프로세스 vs 파싱 워커 프로세스 풀)
+
+lane 스레드 여러 개가 동시에 페이지를 넘기는 상황을 흉내 내어, 워커 수에 따른 초당 처리 페이지 수를 비교합니다.
+
+실행: python -m benchmarks.parse_pool
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawler_bs4 import extract_texts
+from src.crawler_manager import setup_parser_pool
+
+PAGES = 200
+LANES = 4
+
+def make_page():
+    rows = "".join(
+        f"<tr><td class='title'>2025학년도 {i}차 국가장학금 신청 안내 및 교내 장학생 선발 공고</td>"
+        f"<td>학생지원팀</td><td>2025-03-{i % 28 + 1:02d}</td></tr>"
+        for i in range(300)
+    )
+    return f"<html><head><meta charset='utf-8'></head><body><table>{rows}</table></body></html>".encode('utf-8')
+
+def run(workers, content):
+    pool = setup_parser_pool(workers)
+    if pool:
+        # 워커 프로세스 기동 시간은 측정에서 제외
+        list(pool.map(extract_texts, [content] * workers, [None] * workers, [None] * workers,
+                      ["td.title"] * workers, ["css"] * workers))
+
+    def parse(_):
+        if pool:
+            return pool.submit(extract_texts, content, None, None, "td.title", "css").result()
+        return extract_texts(content, None, None, "td.title", "css")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=LANES) as lanes:
+        list(lanes.map(parse, range(PAGES)))
+    elapsed = time.perf_counter() - start
+    if pool:
+        pool.shutdown()
+    return PAGES / elapsed
+
+def main():
+    content = make_page()
+    print(f"{len(content) / 1024:.0f}KB 페이지 {PAGES}개, lane {LANES}개, CPU {os.cpu_count()}개")
+    baseline = run(0, content)
+    print(f"{'메인 프로세스':<12} {baseline:8.1f} pages/s")
+    for workers in (1, 2, 4):
+        throughput = run(workers, content)
+        print(f"{f'워커 {workers}개':<12} {throughput:8.1f} pages/s ({throughput / baseline:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,210 @@ import json
 import sqlite3
 import time
 import socket
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 from src.config import db_config, generate_dynamic_condition
-from src.crawler_manager import setup_driver, perform_crawling, create_crawling_methods
+from src.crawler_manager import perform_crawling, create_crawling_methods, setup_parser_pool
+from src.driver_supervisor import DriverSupervisor
 from src.error_handler import log_error, add_error_dict
-from src.data_handler import extract_element, is_empty_data, save_data, word_filter
-from src.logging_config import setup_logging, log_with_border, current_date
+from src.data_handler import extract_element, is_empty_data, save_data, word_filter, load_known_items, load_saved_method, FILTER_KEYWORDS
+from src.logging_config import setup_logging, shutdown_logging, log_with_border, set_log_context, log_context, current_date
+from src.page_archive import setup_archive, make_page_hook, save_archive_index
+from src.charset_resolver import save_charset_cache
+from src.pagination import get_pagination, track_last_page, crawl_next_pages, DEFAULT_MAX_PAGES
+from src.scheduler import load_timings, save_timings, record_timing, plan_lanes
+from src.feed_reader import load_feeds, save_feeds, needs_discovery, discover_feed, fetch_feed, DEFAULT_RECHECK_DAYS
+from src.page_cache import group_rows_by_url, new_page_cache
+from src.readiness import load_readiness, save_readiness
+from src.profiler import profiling_requested, setup_profiler, profile_org, profile_summary
 from src.slack_messenger import send_slack_scholarship, setup_slack_client, send_slack_opening, send_slack_message, send_slack_failure_list
 
+def crawl_org(idx, row, context):
+    """
+    DB 행 하나(기관)를 크롤링하고, 새 데이터를 저장·필터링하여 Slack으로 전송합니다.
+    여러 lane 스레드에서 동시에 호출되며, WebDriver는 driver.lock으로 한 번에 한 기관만 사용합니다.
+    driver.lock을 기다린 시간은 context["lock_wait"]["seconds"]에 더해집니다. (기관 소요 시간에서 제외)
+
+    :param idx: 행 번호 (로그 및 실패 목록 표시용)
+    :param row: DB 행
+    :param context: main에서 구성한 실행 정보 (logger, config, driver, archive, slack, lock_wait 등)
+    :return: (결과 "success" | "failed" | "skipped", 성공한 크롤링 방식)
+    """
+    logger = context["logger"]
+    column_indices = context["column_indices"]
+    driver = context["driver"]
+    error_dict, failure_list = context["error_dict"], context["failure_list"]
+
+    org_name = row[column_indices["name"]]
+    url = row[column_indices["url"]]
+    css_selector = row[column_indices["css"]]
+    class_name = row[column_indices["class"]]
+    save_path = os.path.join(context["base_path"], f"{org_name}.json")
+
+    # 로그 기록 시작 (기관명)
+    set_log_context(org=org_name, stage="crawl")
+    log_with_border(f"{org_name}({idx})", logger)
+
+    # URL이 없거나, 크롤링에 필요한 선택자/클래스가 모두 없으면 예외처리
+    if not url or (not css_selector and not class_name):
+        msg = "[DB] URL 또는 crawling method가 없습니다."
+        log_error("general", msg, logger)
+        add_error_dict(org_name, "general", msg, error_dict)
+        failure_list.append(f"{org_name} ({idx}) - {msg}")
+        return "skipped", None
+
+    data, success_selector, method_name = None, None, None # 값 초기화
+    error_details = {}  # 각 방식별 에러 저장
+
+    # 등록된 RSS/Atom 피드가 있으면 HTML 크롤링 대신 피드 사용 (실패 시 HTML로 대체)
+    feeds = context["feeds"]
+    feed = feeds.get(org_name) if feeds is not None else None
+    if feed and feed.get("feed_url"):
+        with log_context(method="feed"):
+            items, not_modified = fetch_feed(feed, logger)
+        if not_modified:
+            logger.info(f"[INFO] {org_name}: 새로운 데이터가 없습니다.")
+            return "success", "feed"
+        if items:
+            data, success_selector, method_name = items, feed["feed_url"], "feed"
+    discover = feeds is not None and data is None and needs_discovery(feed, context["feed_recheck_days"])
+
+    # 크롤링 메서드 생성
+    archive = context["archive"]
+    on_page = make_page_hook(archive, org_name, url, logger) if archive else None
+    # 페이지네이션 설정이 있으면 다음 페이지 링크 탐색을 위해 마지막 페이지 기록 (피드 탐색에도 사용)
+    pagination = get_pagination(row, column_indices, context["config"].get("max_pages", DEFAULT_MAX_PAGES), logger)
+    last_page = None
+    if pagination or discover:
+        on_page, last_page = track_last_page(on_page)
+    crawling_methods = []
+    if data is None:
+        crawling_methods = create_crawling_methods(driver, url, css_selector, class_name, logger,
+                                                   on_page=on_page, parser_pool=context["parser_pool"],
+                                                   page_cache=context["page_cache"],
+                                                   readiness=context["readiness"].setdefault(org_name, {}))
+        logger.info(f"Available methods: {" | ".join(method[0] for method in crawling_methods)}")
+
+    # 크롤링 진행
+    recycled = False
+    for method_name, method_func, method_args in crawling_methods:
+        # Selenium 방식은 WebElement 추출까지 WebDriver를 점유
+        uses_driver = method_name.startswith("selenium")
+        lock = driver.lock if uses_driver else nullcontext()
+        try:
+            lock_start = time.monotonic()
+            with lock:
+                context["lock_wait"]["seconds"] += time.monotonic() - lock_start
+                # 첫 Selenium 방식 전에만 브라우저 메모리/페이지 수 확인 후 필요하면 재시작
+                if uses_driver and not recycled:
+                    driver.recycle_if_needed()
+                    recycled = True
+                with log_context(method=method_name):
+                    elements = perform_crawling(method_func, method_name, *method_args, logger=logger)
+                if elements:
+                    data = extract_element(elements)
+                    # 이미 수집한 항목이 나올 때까지 다음 페이지 탐색
+                    if pagination and data:
+                        with log_context(method=method_name):
+                            data = crawl_next_pages(method_name, method_func, method_args, url, data, pagination,
+                                                    load_known_items(save_path), last_page, logger)
+            if elements:
+                success_selector = method_args[1] # 크롤링에 성공한 선택자 방식 저장
+                break
+        except Exception as e:
+            error_details[method_name] = str(e)  # 에러 정보 임시 저장
+            log_error(method_name, str(e), logger)
+
+    # 데이터가 없거나 네 가지 방식 모두 실패한 경우
+    if not data or is_empty_data(data):
+        logger.error(f"[FAILURE] {org_name} | 크롤링 실패 ")
+        if error_details:
+             # `error_details`에 저장된 메서드별 에러를 `add_error_dict`로 전달
+            for method_name, error_msg in error_details.items():
+                add_error_dict(org_name, method_name, error_msg, error_dict)
+        else:
+            add_error_dict(org_name, "general", "[기타] 원인 불명의 오류 발생", error_dict)
+        failure_list.append(f"{org_name}({idx})")
+        return "failed", None
+
+    # 크롤링한 페이지에서 피드 탐색 (다음 실행부터 적용)
+    if discover:
+        with log_context(method="feed"):
+            try:
+                discover_feed(org_name, url, last_page["content"], data, feeds, logger)
+            except Exception as e:
+                # 피드 탐색 실패는 기관 크롤링 결과에 영향을 주지 않음
+                logger.error(f"[FEED] {org_name} 피드 탐색 중 오류 발생: {type(e).__name__} - {e}")
+                feeds[org_name] = {"feed_url": None, "checked_at": time.time()}  # 재탐색 주기까지 다시 시도하지 않음
+
+    # 기존 값과 다른 데이터만, unique_data에 저장
+    set_log_context(stage="save")
+    previous_method = load_saved_method(save_path)
+    # data = { "method", "by", "last_update_date", "data"}
+    unique_data = save_data(data, save_path, method_name, success_selector, logger)
+    # HTML ↔ 피드 전환 시 항목 텍스트 형식이 달라지므로, 이번 결과는 기준 데이터로만 저장
+    if unique_data and previous_method and (previous_method == "feed") != (method_name == "feed"):
+        logger.info(f"[FEED] {org_name}: 수집 방식 전환({previous_method} → {method_name}), 알림 없이 기준 데이터로 저장")
+        unique_data = None
+    # unique_data 검증 및 기본값 설정
+    if not unique_data or "data" not in unique_data or not isinstance(unique_data["data"], list):
+        logger.info(f"[INFO] {org_name}: 새로운 데이터가 없습니다.")
+        unique_data = {"data": []}
+
+    # word_filter로 특정 키워드가 포함된 데이터만 추출
+    set_log_context(stage="filter")
+    passed_unique_data, failed_data = [], []  # 초기화
+
+    if unique_data["data"]:
+        try:
+            passed_unique_data, failed_data = word_filter(FILTER_KEYWORDS, unique_data["data"])
+            if not passed_unique_data:
+                logger.info(f"[INFO] {org_name}: 필터링된 데이터가 없습니다.")
+            if failed_data:
+                logger.debug(f"[DEBUG] {org_name}: 키워드에 매칭되지 않은 데이터: {len(failed_data)}개")
+        except Exception as e:
+            logger.error(f"[ERROR] {org_name}: word_filter 호출 중 오류 발생: {e}")
+
+    # Slack 메시지 전송
+    set_log_context(stage="slack")
+    if passed_unique_data:
+        response = send_slack_scholarship(context["slack_client"], context["slack_channel"], org_name, passed_unique_data, url)
+        if response["status"] == "success":
+            logger.info("[SLACK] 메시지 전송 성공!")
+        elif response["status"] == "error":
+            logger.error(f"[SLACK] 메시지 전송 실패: {response['error']}")
+
+    return "success", method_name
+
+def run_lane(lane, context):
+    """
+    lane에 배정된 URL 그룹들을 순서대로 크롤링하고 기관별 소요 시간을 기록합니다.
+    같은 그룹의 기관들은 페이지 캐시를 공유하여 페이지를 한 번만 가져오고,
+    결과·기록·실패 목록은 기관별로 따로 처리합니다.
+
+    :param lane: [[(idx, row), ...], ...] - 같은 URL을 쓰는 행 그룹의 리스트
+    :return: [(org_name, 결과, 성공한 방식, 소요 시간), ...] - 소요 시간에서 WebDriver lock 대기 시간은 제외
+    """
+    results = []
+    for group in lane:
+        group_context = dict(context, page_cache=new_page_cache())
+        for idx, row in group:
+            org_name = row[context["column_indices"]["name"]]
+            lock_wait = {"seconds": 0.0}
+            org_start = time.monotonic()
+            with profile_org(context["profiler"], org_name):
+                status, method_name = crawl_org(idx, row, dict(group_context, lock_wait=lock_wait))
+            results.append((org_name, status, method_name, time.monotonic() - org_start - lock_wait["seconds"]))
+    return results
+
 # 메인 실행 부분
-def main(config_key):
+def main(config_key, profile=False):
     """
     주어진 config_key (univ 또는 nonuniv)를 기반으로 크롤링을 실행합니다.
 
     :param config_key: "univ" 또는 "nonuniv" 설정 키
+    :param profile: 기관별 프로파일링 여부 (환경 변수 SCRAPER_PROFILE=1로도 설정 가능)
     """
     # logger 설정
     logger = setup_logging(config_key)
@@ -42,6 +232,12 @@ def main(config_key):
     base_path = f"data/{config_key}"
     os.makedirs(base_path, exist_ok=True)
 
+    # 페이지 아카이브 설정 (db_config의 "archive" 항목이 enabled일 때만)
+    archive = setup_archive(config_key, config.get("archive"), logger)
+
+    # 느린 기관 프로파일링 (--profile 또는 SCRAPER_PROFILE=1일 때만)
+    profiler = setup_profiler(config_key, config.get("profile"), logger) if profiling_requested(profile) else None
+
     # 슬랙 설정
     SLACK_CHANNEL_TEST = os.getenv("SLACK_CHANNEL_TEST")
     SLACK_CHANNEL_JANGHAK = os.getenv("SLACK_CHANNEL_JANGHAK")
@@ -51,7 +247,14 @@ def main(config_key):
     error_dict = {}
     failure_list = []
     success_count, total_rows = 0, 0
-    
+    predicted_makespan, actual_makespan = None, None
+    driver, conn, slack_client, parser_pool = None, None, None, None
+    # RSS/Atom 피드 우선 수집 (db_config의 "feeds" 항목이 enabled일 때만)
+    feeds_config = config.get("feeds") or {}
+    feeds = load_feeds(config_key) if feeds_config.get("enabled") else None
+    # 기관별 Selenium 요소 등장 기록 (대기 시간 학습)
+    readiness = load_readiness(config_key)
+
     try:
          # 네트워크 연결 확인
         try:
@@ -62,13 +265,23 @@ def main(config_key):
             log_error("network", msg, logger)
             return
         
-        # WebDriver 생성
+        # WebDriver 생성 (메모리/페이지 수 기준으로 자동 재시작)
         try:
-            driver = setup_driver()
+            driver = DriverSupervisor(logger, **config.get("driver", {}))
         except Exception as e:
             logger.error(f"[DRIVER] 초기화 실패: {type(e).__name__} - {e}")
             raise RuntimeError(f"[DRIVER] 초기화 실패: {e}")  # 드라이버가 없으면 크롤링을 진행할 수 없으므로 예외 발생
 
+        # bs4 파싱·추출용 워커 프로세스 (db_config "parse_workers", 0이면 메인 프로세스에서 파싱)
+        parse_workers = config.get("parse_workers", 0)
+        parser_pool = setup_parser_pool(parse_workers)
+        # lane 하나는 파싱 결과를 기다리는 동안 다음 요청을 보내지 않으므로, 동시에 바쁜 워커 수는 lane 수를 넘지 못함
+        # → 파싱 워커를 모두 쓰도록 빠른 lane 수(db_config "fast_lanes")를 워커 수 이상으로 맞춤
+        fast_lanes = config.get("fast_lanes", 1)
+        if parser_pool and fast_lanes < parse_workers:
+            logger.info(f"[SCHEDULE] 파싱 워커 {parse_workers}개에 맞춰 빠른 lane 수를 {fast_lanes} → {parse_workers}로 조정")
+            fast_lanes = parse_workers
+
         # SQLite 데이터베이스 연결
         conn = sqlite3.connect(db_path, timeout=5.0)
         cursor = conn.cursor()
@@ -84,103 +297,69 @@ def main(config_key):
         slack_client = setup_slack_client()
         send_slack_opening(config_key, slack_client, SLACK_CHANNEL_JANGHAK)
 
-        logger.info(f"|| {config_key} || 총 {total_rows}개 데이터 크롤링 시작")
-        for idx, row in enumerate(rows, start=1):
-            org_name = row[column_indices["name"]]
-            url = row[column_indices["url"]]
-            css_selector = row[column_indices["css"]]
-            class_name = row[column_indices["class"]]
-            save_path = os.path.join(base_path, f"{org_name}.json")
-            
-            # 로그 기록 시작 (기관명)
-            log_with_border(f"{org_name}({idx})", logger)
-
-            # URL이 없거나, 크롤링에 필요한 선택자/클래스가 모두 없으면 예외처리
-            if not url or (not css_selector and not class_name):
-                msg = "[DB] URL 또는 crawling method가 없습니다."
-                log_error("general", msg, logger)
-                add_error_dict(org_name, "general", msg, error_dict)
-                failure_list.append(f"{org_name} ({idx}) - {msg}")
-                continue
-
-            # 크롤링 메서드 생성
-            crawling_methods = create_crawling_methods(driver, url, css_selector, class_name, logger)
-            logger.info(f"Available methods: {" | ".join(method[0] for method in crawling_methods)}")
-
-            data, success_selector, method_name = None, None, None # 값 초기화
-            error_details = {}  # 각 방식별 에러 저장
-
-            # 크롤링 진행
-            for method_name, method_func, method_args in crawling_methods:
-                try:
-                    elements = perform_crawling(method_func, method_name, *method_args, logger=logger)
-                    if elements:
-                        data = extract_element(elements)
-                        success_selector = method_args[1] # 크롤링에 성공한 선택자 방식 저장
-                        break
-                except Exception as e:
-                    error_details[method_name] = str(e)  # 에러 정보 임시 저장
-                    log_error(method_name, str(e), logger)
-
-            # 데이터가 없거나 네 가지 방식 모두 실패한 경우
-            if not data or is_empty_data(data):
-                logger.error(f"[FAILURE] {org_name} | 크롤링 실패 ")
-                if error_details:
-                     # `error_details`에 저장된 메서드별 에러를 `add_error_dict`로 전달
-                    for method_name, error_msg in error_details.items():
-                        add_error_dict(org_name, method_name, error_msg, error_dict)
-                else:
-                    add_error_dict(org_name, "general", "[기타] 원인 불명의 오류 발생", error_dict)
-                failure_list.append(f"{org_name}({idx})")
-                continue
-
-            # 기존 값과 다른 데이터만, unique_data에 저장
-            # data = { "method", "by", "last_update_date", "data"}
-            unique_data = save_data(data, save_path, method_name, success_selector, logger)
-            # unique_data 검증 및 기본값 설정
-            if not unique_data or "data" not in unique_data or not isinstance(unique_data["data"], list):
-                logger.info(f"[INFO] {org_name}: 새로운 데이터가 없습니다.")
-                unique_data = {"data": []}
-
-            # word_filter로 특정 키워드가 포함된 데이터만 추출
-            keywords = ['장학', '지원']
-            passed_unique_data, failed_data = [], []  # 초기화
-
-            if unique_data["data"]:
-                try:
-                    passed_unique_data, failed_data = word_filter(keywords, unique_data["data"])
-                    if not passed_unique_data:
-                        logger.info(f"[INFO] {org_name}: 필터링된 데이터가 없습니다.")
-                    if failed_data:
-                        logger.debug(f"[DEBUG] {org_name}: 키워드에 매칭되지 않은 데이터: {len(failed_data)}개")
-                except Exception as e:
-                    logger.error(f"[ERROR] {org_name}: word_filter 호출 중 오류 발생: {e}")
-
-            # Slack 메시지 전송
-            if passed_unique_data:
-                response = send_slack_scholarship(slack_client, SLACK_CHANNEL_JANGHAK, org_name, passed_unique_data, url)
-                if response["status"] == "success":
-                    logger.info("[SLACK] 메시지 전송 성공!")
-                elif response["status"] == "error":
-                    logger.error(f"[SLACK] 메시지 전송 실패: {response['error']}")
+        # 같은 URL을 쓰는 행끼리 묶은 뒤, 과거 소요 시간 기준으로 lane 배치 (느린 Selenium 기관 / 빠른 정적 기관)
+        timings = load_timings(config_key)
+        name_index = column_indices["name"]
+        groups = group_rows_by_url(list(enumerate(rows, start=1)), column_indices)
+        lanes, predicted_makespan = plan_lanes(
+            [([row[name_index] for _, row in group], group) for group in groups],
+            timings, fast_lanes
+        )
+        context = {
+            "logger": logger,
+            "config": config,
+            "column_indices": column_indices,
+            "base_path": base_path,
+            "driver": driver,
+            "archive": archive,
+            "profiler": profiler,
+            "parser_pool": parser_pool,
+            "feeds": feeds,
+            "readiness": readiness,
+            "feed_recheck_days": feeds_config.get("recheck_days", DEFAULT_RECHECK_DAYS),
+            "slack_client": slack_client,
+            "slack_channel": SLACK_CHANNEL_JANGHAK,
+            "error_dict": error_dict,
+            "failure_list": failure_list,
+        }
 
-            success_count += 1
+        logger.info(f"|| {config_key} || 총 {total_rows}개 데이터 크롤링 시작 "
+                    f"(고유 URL {len(groups)}개, lane {len(lanes)}개, 예상 소요 {predicted_makespan:.0f}초)")
+        crawl_start = time.monotonic()
+        # cProfile은 스레드 간 동시 실행이 불가능하므로 프로파일링 중에는 lane을 순차 실행
+        max_workers = 1 if profiler else max(1, len(lanes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_lane, lane, context) for lane in lanes]
+            for future in futures:
+                for org_name, status, method_name, duration in future.result():
+                    if status == "success":
+                        success_count += 1
+                    # 프로파일링 중의 소요 시간은 측정 부하와 순차 실행으로 부풀려지므로 기록하지 않음
+                    if status != "skipped" and not profiler:
+                        record_timing(timings, org_name, duration, method_name)
+        actual_makespan = time.monotonic() - crawl_start
+        if not profiler:
+            save_timings(config_key, timings, logger)
 
     except Exception as e:
         logger.error(f"{e}")
         raise
 
     finally:
+        set_log_context(org=None, stage="report")
         log_with_border("! FINISHED !", logger)
         
         # 반드시 자원 정리
         try:
             if driver:
                 driver.quit()
-                logger.info("[DRIVER] WebDriver 종료")
+                logger.info(f"[DRIVER] WebDriver 종료 (재시작 {driver.restart_count}회)")
         except Exception as e:
             logger.error(f"[DRIVER] 종료 중 오류 발생: {e}")
 
+        if parser_pool:
+            parser_pool.shutdown()
+
         try:
             if conn:
                 conn.close()
@@ -188,6 +367,13 @@ def main(config_key):
         except Exception as e:
             logger.error(f"[DB] 종료 중 오류 발생: {e}")
 
+        if archive:
+            save_archive_index(archive, logger)
+        save_charset_cache(logger)
+        if feeds is not None:
+            save_feeds(config_key, feeds, logger)
+        save_readiness(config_key, {org: stats for org, stats in readiness.items() if stats}, logger)
+
         # 종료 시각 기록
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -196,6 +382,11 @@ def main(config_key):
         # 총 결과 로그
         if total_rows:
             logger.info(f"총 {total_rows}개 데이터 중 {success_count}개 업데이트 성공, {len(failure_list)}개 실패")
+        if actual_makespan is not None:
+            logger.info(f"[SCHEDULE] 예상 소요 시간: {predicted_makespan:.2f}초 | 실제 크롤링 시간: {actual_makespan:.2f}초")
+        hot_functions = profile_summary(profiler)
+        for line in hot_functions:
+            logger.info(f"[PROFILE] {line}")
 
         # 총 결과 로그를 Slack으로 전송
         try:
@@ -206,6 +397,10 @@ def main(config_key):
                 f"> *실패*: `{len(failure_list)}`개\n"
                 f"> *소요 시간*: `{elapsed_time:.2f}`초 ⏱️\n"
             )
+            if actual_makespan is not None:
+                result_message += f"> *예상/실제 크롤링 시간*: `{predicted_makespan:.0f}`초 / `{actual_makespan:.0f}`초\n"
+            if hot_functions:
+                result_message += "> *프로파일*:\n" + "".join(f">   `{line}`\n" for line in hot_functions)
             response = send_slack_message(slack_client, SLACK_CHANNEL_JANGHAK, result_message)
             if response["status"] == "success":
                 logger.info("총 결과 로그 Slack 메시지 전송 성공")
@@ -245,7 +440,14 @@ def main(config_key):
         except Exception as e:
             logger.error(f"실패 목록을 저장하는 중 오류 발생: {e}")
 
+        # 큐에 남은 로그 기록 후 로깅 스레드 종료
+        shutdown_logging(logger)
+
 if __name__ == "__main__":
-    import sys
-    target = sys.argv[1] if len(sys.argv) > 1 else "univ"
-    main(target)
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="장학금 공지 크롤러")
+    parser.add_argument("target", nargs="?", default="univ", help="db_config 설정 키 (univ 또는 nonuniv)")
+    parser.add_argument("--profile", action="store_true",
+                        help="기관별 cProfile/tracemalloc 측정 후 느린 기관만 logs/{target}/{date}/profiles/에 저장")
+    args = parser.parse_args()
+    main(args.target, profile=args.profile)
\ No newline at end of file
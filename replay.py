@@ -0,0 +1,154 @@
+import os
+import json
+import sqlite3
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from src.config import db_config
+from src.charset_resolver import decode_content
+from src.crawler_bs4 import parse_elements
+from src.data_handler import extract_element, is_empty_data, extract_new_information, word_filter, FILTER_KEYWORDS
+from src.logging_config import setup_logging, log_with_border, current_date
+from src.page_archive import setup_archive, latest_entries, load_page
+
+def replay_org(org_name, css_selector, class_name, archive_dir, entry, save_path):
+    """
+    아카이브된 페이지 하나에 대해 추출 → 기존 데이터와 비교 → 키워드 필터링을 수행합니다.
+    네트워크에 접근하지 않으며, 저장된 데이터 파일도 수정하지 않습니다.
+    (ProcessPoolExecutor 워커에서 실행되므로 모듈 최상위 함수로 둡니다.)
+
+    :return: 기관별 재추출 결과 dict
+    """
+    result = {
+        "org": org_name,
+        "url": entry["url"],
+        "fetched_at": datetime.fromtimestamp(entry["fetched_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+        "archived_method": entry["method"],
+        "method": None,
+        "count": 0,
+        "new": [],
+        "passed": [],
+        "error": None,
+    }
+    try:
+        content = load_page({"base_dir": archive_dir}, entry)
+        if entry["kind"] == "dom":
+            content = content.decode('utf-8')
+        else:
+            content = decode_content(content, entry["url"])
+    except Exception as e:
+        result["error"] = f"[ARCHIVE] 페이지 로드 실패: {e}"
+        return result
+
+    data = None
+    for by_type, selector in (("css", css_selector), ("class", class_name)):
+        if not selector:
+            continue
+        try:
+            data = extract_element(parse_elements(content, selector, by_type))
+        except Exception as e:
+            result["error"] = f"[{by_type}] {e}"
+            continue
+        if data and not is_empty_data(data):
+            result["method"] = f"bs4_{by_type}"
+            break
+        data = None
+
+    if not data:
+        result["error"] = result["error"] or "선택자에 해당하는 요소가 없습니다."
+        return result
+
+    # 저장된 데이터와 비교 (파일은 수정하지 않음)
+    old_data = {}
+    if os.path.exists(save_path):
+        with open(save_path, 'r', encoding='utf-8') as f:
+            old_data = json.load(f)
+    new_data = {"method": result["method"], "by": selector, "last_update_date": result["fetched_at"], "data": data}
+    unique_data = extract_new_information(old_data, new_data)
+
+    result["count"] = len(data)
+    result["new"] = unique_data["data"]
+    result["passed"], _ = word_filter(FILTER_KEYWORDS, unique_data["data"])
+    return result
+
+def replay(config_key, workers=None):
+    """
+    아카이브된 페이지를 대상으로 현재 DB의 css/class 선택자로 추출·비교·필터링을 병렬 재실행합니다.
+    사이트 개편 후 선택자를 수정했을 때, 재크롤링 없이 전체 기관의 결과를 검증하는 용도입니다.
+
+    :param config_key: "univ" 또는 "nonuniv" 설정 키
+    :param workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+    """
+    logger = setup_logging(config_key)
+    start_time = time.time()
+
+    if config_key not in db_config:
+        logger.error(f"Invalid config_key: {config_key}")
+        raise KeyError(f"Invalid config_key: {config_key}")
+    config = db_config[config_key]
+    columns = config["columns"]
+
+    # 아카이브는 설정과 무관하게 읽기 전용으로 연다
+    archive = setup_archive(config_key, {**config.get("archive", {}), "enabled": True}, logger)
+    if not archive:
+        return
+    entries = latest_entries(archive)
+    if not entries:
+        logger.warning(f"[REPLAY] {config_key} 아카이브가 비어 있습니다.")
+        return
+
+    conn = sqlite3.connect(config["db_path"], timeout=5.0)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT * FROM {config['table']}")
+        rows = cursor.fetchall()
+        col_names = [desc[0] for desc in cursor.description]
+    finally:
+        conn.close()
+    column_indices = { key: col_names.index(val) for key, val in columns.items() }
+
+    log_with_border(f"REPLAY {config_key} ({len(entries)})", logger)
+    results = []
+    # 로깅 스레드가 실행 중이므로 fork 대신 spawn으로 워커 생성
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = []
+        for row in rows:
+            org_name = row[column_indices["name"]]
+            if org_name not in entries:
+                continue
+            save_path = os.path.join("data", config_key, f"{org_name}.json")
+            futures.append(executor.submit(
+                replay_org, org_name, row[column_indices["css"]], row[column_indices["class"]],
+                archive["base_dir"], entries[org_name], save_path
+            ))
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result["error"]:
+                logger.error(f"[REPLAY] {result['org']} | 추출 실패: {result['error']}")
+            else:
+                logger.info(f"[REPLAY] {result['org']} | {result['method']} {result['count']}개 추출, "
+                            f"새 데이터 {len(result['new'])}개, 필터 통과 {len(result['passed'])}개")
+
+    failed = [result for result in results if result["error"]]
+    elapsed_time = time.time() - start_time
+    logger.info(f"[REPLAY] 총 {len(results)}개 기관 중 {len(results) - len(failed)}개 성공, "
+                f"{len(failed)}개 실패 ({elapsed_time:.2f}초)")
+
+    report_path = os.path.join("logs", config_key, current_date, f"replay_{datetime.now().strftime('%H%M%S')}.json")
+    try:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(sorted(results, key=lambda result: result["org"]), f, ensure_ascii=False, indent=4)
+        logger.info(f"[REPLAY] 결과를 {report_path}에 저장했습니다.")
+    except Exception as e:
+        logger.error(f"[REPLAY] 결과 저장 중 오류 발생: {e}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="아카이브된 페이지로 추출·비교·필터링을 재실행합니다.")
+    parser.add_argument("target", nargs="?", default="univ", help="univ 또는 nonuniv")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 코어 수)")
+    args = parser.parse_args()
+    replay(args.target, args.workers)
@@ -0,0 +1,158 @@
+import codecs
+import json
+import os
+import re
+from urllib.parse import urlparse
+
+from charset_normalizer import from_bytes
+
+CHARSET_CACHE_PATH = os.path.join("data", "cache", "charset.json")
+
+# <meta charset="..."> 또는 <meta http-equiv="Content-Type" content="text/html; charset=...">
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w\-:.]+)', re.IGNORECASE)
+# <?xml version="1.0" encoding="..."?> (RSS/Atom 피드)
+_XML_DECLARATION_CHARSET = re.compile(rb'^\s*<\?xml[^>]+encoding\s*=\s*["\']([\w\-:.]+)', re.IGNORECASE)
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?\s*([\w\-:.]+)', re.IGNORECASE)
+_META_SCAN_BYTES = 4096
+
+# EUC-KR로 선언된 페이지도 실제로는 CP949 확장 문자를 쓰는 경우가 많으므로 CP949로 디코딩
+_CHARSET_ALIASES = {
+    "euc_kr": "cp949",
+    "ks_c_5601-1987": "cp949",
+    "ksc5601": "cp949",
+    "x-windows-949": "cp949",
+}
+# HTTP 기본값으로 붙는 경우가 많아 신뢰할 수 없는 인코딩 (어떤 바이트도 디코딩에 성공함)
+_UNRELIABLE_CHARSETS = {"iso8859-1", "cp1252"}
+
+_charset_cache = None  # { host: encoding }, 실행 간 유지 (data/cache/charset.json)
+
+def normalize_charset(name):
+    """
+    인코딩 이름을 파이썬 코덱 이름으로 정규화합니다. 알 수 없는 이름이면 None을 반환합니다.
+    """
+    if not name:
+        return None
+    name = name.strip().lower()
+    name = _CHARSET_ALIASES.get(name, name)
+    try:
+        name = codecs.lookup(name).name
+    except LookupError:
+        return None
+    return _CHARSET_ALIASES.get(name, name)
+
+def _get_cache():
+    global _charset_cache
+    if _charset_cache is None:
+        _charset_cache = {}
+        if os.path.exists(CHARSET_CACHE_PATH):
+            try:
+                with open(CHARSET_CACHE_PATH, 'r', encoding='utf-8') as f:
+                    _charset_cache = json.load(f)
+            except (OSError, ValueError):
+                _charset_cache = {}
+    return _charset_cache
+
+def save_charset_cache(logger):
+    """
+    호스트별로 확인된 인코딩을 파일로 저장합니다.
+    """
+    if _charset_cache is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(CHARSET_CACHE_PATH), exist_ok=True)
+        with open(CHARSET_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(_charset_cache, f, ensure_ascii=False, indent=4, sort_keys=True)
+    except Exception as e:
+        logger.error(f"[CHARSET] 인코딩 캐시 저장 중 오류 발생: {e}")
+
+def _try_decode(content, encoding):
+    try:
+        return content.decode(encoding)
+    except (UnicodeDecodeError, LookupError):
+        return None
+
+def resolve_and_decode(content, content_type=None, cached_encoding=None):
+    """
+    페이지 본문(bytes)의 인코딩을 결정하고 한 번만 디코딩합니다.
+    파일/캐시 상태를 건드리지 않으므로 파싱 워커 프로세스에서도 호출할 수 있습니다.
+
+    인코딩은 다음 순서로 결정하며, 엄격한 디코딩에 성공한 인코딩만 채택합니다.
+    1. HTTP Content-Type 헤더의 charset
+    2. HTML <meta> 태그 또는 XML 선언(<?xml encoding=...?>)의 charset
+    3. 이전 실행에서 확인된 호스트별 인코딩 (cached_encoding)
+    4. UTF-8 (엄격한 디코딩은 다른 인코딩에서 거의 성공하지 않음)
+    5. charset_normalizer 자동 감지 (후보 중 한국어 인코딩 우선)
+
+    :param content: 페이지 본문 (bytes)
+    :param content_type: HTTP Content-Type 헤더 값
+    :param cached_encoding: 호스트별로 캐시된 인코딩
+    :return: (디코딩된 문자열, 확인된 인코딩 또는 None, 자동 감지 여부)
+    """
+    candidates = []
+    header_match = _HEADER_CHARSET.search(content_type or "")
+    if header_match:
+        candidates.append(normalize_charset(header_match.group(1)))
+    meta_match = (_META_CHARSET.search(content[:_META_SCAN_BYTES])
+                  or _XML_DECLARATION_CHARSET.search(content[:_META_SCAN_BYTES]))
+    if meta_match:
+        candidates.append(normalize_charset(meta_match.group(1).decode('ascii', 'ignore')))
+    candidates.append(cached_encoding)
+    candidates.append("utf-8")
+
+    for encoding in candidates:
+        if not encoding or encoding in _UNRELIABLE_CHARSETS:
+            continue
+        text = _try_decode(content, encoding)
+        if text is not None:
+            return text, encoding, False
+
+    # 자동 감지 (느리므로 마지막 수단), 짧은 페이지에서 big5 등으로 오감지하는 경우가 있어 CP949 후보 우선
+    matches = [normalize_charset(match.encoding) for match in from_bytes(content)]
+    encoding = "cp949" if "cp949" in matches else next(iter(matches), None)
+    text = _try_decode(content, encoding) if encoding else None
+    if text is not None:
+        return text, encoding, True
+
+    return content.decode('utf-8', errors='replace'), None, True
+
+def get_cached_charset(url):
+    """
+    URL 호스트에 대해 캐시된 인코딩을 반환합니다.
+    """
+    return _get_cache().get(urlparse(url).netloc.lower() if url else "")
+
+def remember_charset(url, encoding, detected=False, logger=None):
+    """
+    확인된 인코딩을 호스트별 캐시에 기록합니다. 인코딩을 확인하지 못했으면(None) 경고만 남깁니다.
+    """
+    host = urlparse(url).netloc.lower() if url else ""
+    if encoding is None:
+        if logger:
+            logger.warning(f"[CHARSET] {host} 인코딩 확인 실패, UTF-8로 대체 디코딩")
+        return
+    if detected and logger:
+        logger.info(f"[CHARSET] {host} 인코딩 감지: {encoding}")
+    _get_cache()[host] = encoding
+
+def decode_content(content, url, content_type=None, logger=None):
+    """
+    페이지 본문(bytes)을 resolve_and_decode로 디코딩하고, 확인된 인코딩을 호스트별로 캐시합니다.
+
+    :param content: 페이지 본문 (bytes)
+    :param url: 요청 URL (호스트별 캐시 키)
+    :param content_type: HTTP Content-Type 헤더 값
+    :param logger: 로깅 객체 (선택)
+    :return: 디코딩된 문자열
+    """
+    if isinstance(content, str):
+        return content
+    text, encoding, detected = resolve_and_decode(content, content_type, get_cached_charset(url))
+    remember_charset(url, encoding, detected, logger)
+    return text
+
+def decode_response(res, logger=None):
+    """
+    requests 응답 본문을 decode_content로 디코딩합니다.
+    """
+    return decode_content(res.content, res.url, res.headers.get("Content-Type"), logger)
@@ -2,15 +2,21 @@ from bs4 import BeautifulSoup
 import requests
 import socket
 
+from src.charset_resolver import decode_response, resolve_and_decode, get_cached_charset, remember_charset
+from src.data_handler import extract_element
+from src.page_cache import fetch_page
 
-def bs4_css(url, css_selector, logger):
+
+def bs4_css(url, css_selector, logger, on_page=None, parser_pool=None, page_cache=None):
     """
     BeautifulSoup를 사용하여 주어진 URL에서 CSS 셀렉터로 요소를 추출합니다.
+    on_page가 주어지면 가져온 페이지 본문을 on_page(content, method_name)으로 전달합니다.
+    parser_pool이 주어지면 파싱·추출을 워커 프로세스에서 수행하고 텍스트 리스트를 반환합니다.
+    page_cache가 주어지면 같은 URL을 쓰는 기관들이 한 번 가져온 응답을 공유합니다.
     """
     try:
-        # HTTP 요청 보내기
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
+        # HTTP 요청 보내기 (같은 URL 그룹에서 이미 가져왔으면 재사용)
+        res = fetch_page(url, page_cache)
         logger.info(f"[BS4_CSS] URL 요청 성공")
     except requests.exceptions.Timeout as e:
         logger.error(f"[BS4_CSS] 요청 시간이 초과되었습니다: {e}")
@@ -25,9 +31,17 @@ def bs4_css(url, css_selector, logger):
         logger.error(f"[BS4_CSS] 기타 오류가 발생했습니다: {e}")
         return None
 
+    # 가져온 페이지를 아카이브에 전달 (선택자 성공 여부와 무관)
+    if on_page:
+        on_page(res.content, "bs4_css")
+
+    # 프로세스 풀 모드: 원본 bytes와 선택자만 워커로 넘기고, 정리된 텍스트 목록만 돌려받음
+    if parser_pool:
+        return parse_in_pool(parser_pool, res, css_selector, "css", "BS4_CSS", logger)
+
     try:
-        # HTML 파싱하기
-        soup = BeautifulSoup(res.content, 'html.parser')
+        # HTML 파싱하기 (인코딩을 확인해 한 번만 디코딩한 뒤 파싱)
+        soup = BeautifulSoup(decode_response(res, logger), 'html.parser')
         logger.info("[BS4_CSS] HTML 파싱 성공")
     except Exception as e:
         logger.error(f"[BS4_CSS] HTML 파싱 중 오류가 발생했습니다: {e}")
@@ -46,14 +60,16 @@ def bs4_css(url, css_selector, logger):
 
     return elements
 
-def bs4_class(url, class_name, logger):
+def bs4_class(url, class_name, logger, on_page=None, parser_pool=None, page_cache=None):
     """
     BeautifulSoup를 사용하여 주어진 URL에서 클래스 이름으로 요소를 추출합니다.
+    on_page가 주어지면 가져온 페이지 본문을 on_page(content, method_name)으로 전달합니다.
+    parser_pool이 주어지면 파싱·추출을 워커 프로세스에서 수행하고 텍스트 리스트를 반환합니다.
+    page_cache가 주어지면 같은 URL을 쓰는 기관들이 한 번 가져온 응답을 공유합니다.
     """
     try:
-        # HTTP 요청 보내기
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
+        # HTTP 요청 보내기 (같은 URL 그룹에서 이미 가져왔으면 재사용)
+        res = fetch_page(url, page_cache)
         logger.info("[BS4_CLASS] URL 요청 성공")
     except requests.exceptions.Timeout as e:
         logger.error(f"[BS4_CLASS] 요청 시간이 초과되었습니다: {e}")
@@ -68,9 +84,17 @@ def bs4_class(url, class_name, logger):
         logger.error(f"[BS4_CLASS] 기타 오류가 발생했습니다: {e}")
         return None
 
+    # 가져온 페이지를 아카이브에 전달 (선택자 성공 여부와 무관)
+    if on_page:
+        on_page(res.content, "bs4_class")
+
+    # 프로세스 풀 모드: 원본 bytes와 선택자만 워커로 넘기고, 정리된 텍스트 목록만 돌려받음
+    if parser_pool:
+        return parse_in_pool(parser_pool, res, class_name, "class", "BS4_CLASS", logger)
+
     try:
-        # HTML 파싱하기
-        soup = BeautifulSoup(res.content, 'html.parser')
+        # HTML 파싱하기 (인코딩을 확인해 한 번만 디코딩한 뒤 파싱)
+        soup = BeautifulSoup(decode_response(res, logger), 'html.parser')
         logger.info("[BS4_CLASS] HTML 파싱 성공")
     except Exception as e:
         logger.error(f"[BS4_CLASS] HTML 파싱 중 오류가 발생했습니다: {e}")
@@ -88,3 +112,52 @@ def bs4_class(url, class_name, logger):
         return None
 
     return elements
+
+def parse_elements(content, selector, by_type):
+    """
+    이미 가져온 페이지 본문을 파싱하여 선택자에 해당하는 요소를 반환합니다.
+    (아카이브 재추출 등 네트워크 없이 파싱만 필요한 경우 사용)
+
+    :param content: 페이지 본문 (디코딩된 str 권장, bytes면 BeautifulSoup이 인코딩을 감지)
+    :param selector: 선택자 (CSS 셀렉터 또는 클래스 이름)
+    :param by_type: 선택자 유형 ('css' 또는 'class')
+    :return: 요소 리스트
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    if by_type == "css":
+        return soup.select(selector)
+    if by_type == "class":
+        return soup.find_all(class_=selector)
+    raise ValueError(f"잘못된 by_type: {by_type}")
+
+def extract_texts(content, content_type, cached_encoding, selector, by_type):
+    """
+    디코딩 → 파싱 → 요소 선택 → 텍스트 정리를 한 번에 수행합니다.
+    파싱 워커 프로세스에서 실행되며, 파싱 트리 대신 정리된 텍스트 리스트만 반환합니다.
+
+    :return: (확인된 인코딩, 자동 감지 여부, 텍스트 리스트)
+    """
+    text, encoding, detected = resolve_and_decode(content, content_type, cached_encoding)
+    return encoding, detected, extract_element(parse_elements(text, selector, by_type))
+
+def parse_in_pool(parser_pool, res, selector, by_type, tag, logger):
+    """
+    HTTP 응답을 파싱 워커 프로세스로 넘겨 텍스트 리스트를 추출합니다.
+    워커가 확인한 인코딩은 메인 프로세스의 호스트별 캐시에 반영합니다.
+
+    :return: 텍스트 리스트, 요소가 없거나 오류 발생 시 None
+    """
+    try:
+        encoding, detected, texts = parser_pool.submit(
+            extract_texts, res.content, res.headers.get("Content-Type"), get_cached_charset(res.url), selector, by_type
+        ).result()
+    except Exception as e:
+        logger.error(f"[{tag}] 파싱 워커에서 오류가 발생했습니다: {e}")
+        return None
+    remember_charset(res.url, encoding, detected, logger)
+
+    if not texts:
+        logger.warning(f"[{tag}] 지정한 선택자에 해당하는 요소를 찾을 수 없습니다.")
+        return None
+    logger.info(f"[{tag}] 워커 파싱 및 요소 선택 성공")
+    return texts
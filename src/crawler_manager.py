@@ -3,6 +3,18 @@ from src.crawler_selenium import selenium_crawling
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 from requests.exceptions import ConnectionError, Timeout
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+def setup_parser_pool(workers):
+    """
+    bs4 파싱·추출용 워커 프로세스 풀을 생성합니다. workers가 0이면 None (메인 프로세스에서 파싱)
+    각 lane은 파싱 요청을 하나씩 보내고 결과를 기다리므로, main에서 빠른 lane 수를 workers 이상으로 맞춥니다.
+    크롤링 lane 스레드가 실행 중인 프로세스에서 fork하지 않도록 spawn 방식을 사용합니다.
+    """
+    if not workers:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
 
 def setup_driver():
     options = webdriver.ChromeOptions()
@@ -40,15 +52,20 @@ def perform_crawling(method, method_name, *args, logger):
     except Exception as e:
         raise RuntimeError(f"[{method_name}] {str(e)}") from e
 
-def create_crawling_methods(driver, url, css_selector, class_name, logger):
+def create_crawling_methods(driver, url, css_selector, class_name, logger, on_page=None, parser_pool=None, page_cache=None,
+                            readiness=None):
     """
     주어진 인자에 따라 크롤링 메서드 리스트를 생성합니다.
+    on_page가 주어지면 각 메서드가 가져온 페이지를 on_page(content, method_name)으로 전달합니다.
+    parser_pool이 주어지면 bs4 방식의 파싱·추출을 워커 프로세스에서 수행합니다.
+    page_cache가 주어지면 같은 URL을 쓰는 기관들이 가져온 페이지를 공유합니다.
+    readiness가 주어지면 Selenium 방식의 대기 시간을 기관의 과거 요소 등장 기록으로 정합니다.
     """
     method_configs = [
-        ("bs4_css", bs4_css, [url, css_selector, logger]) if css_selector else None,
-        ("bs4_class", bs4_class, [url, class_name, logger]) if class_name else None,
-        ("selenium_css", selenium_crawling, [driver, url, css_selector, "css", logger]) if css_selector else None,
-        ("selenium_class", selenium_crawling, [driver, url, class_name, "class", logger]) if class_name else None
+        ("bs4_css", bs4_css, [url, css_selector, logger, on_page, parser_pool, page_cache]) if css_selector else None,
+        ("bs4_class", bs4_class, [url, class_name, logger, on_page, parser_pool, page_cache]) if class_name else None,
+        ("selenium_css", selenium_crawling, [driver, url, css_selector, "css", logger, on_page, page_cache, readiness]) if css_selector else None,
+        ("selenium_class", selenium_crawling, [driver, url, class_name, "class", logger, on_page, page_cache, readiness]) if class_name else None
     ]
     
     # 유효한 메서드만 필터링,  None 값 제거
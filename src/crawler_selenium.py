@@ -1,29 +1,57 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
+import time
 
-def fetch_elements_selenium(driver, url, selector, by, logger):
+from src.page_cache import open_rendered_page
+from src.readiness import wait_budget, record_appearance, record_miss, DEFAULT_TIMEOUT, DEFAULT_FRAME_TIMEOUT
+
+def _method_name(by):
+    """
+    Selenium By 값을 크롤링 방식 이름(selenium_css / selenium_class)으로 변환합니다.
+    """
+    return "selenium_css" if by == By.CSS_SELECTOR else "selenium_class"
+
+def fetch_elements_selenium(driver, url, selector, by, logger, on_page=None, page_cache=None, readiness=None):
     """
     Selenium을 사용하여 지정된 URL에서 요소를 추출합니다.
+    on_page가 주어지면 렌더링된 DOM을 on_page(content, method_name)으로 전달합니다.
+    page_cache가 주어지면 같은 URL 그룹에서 이미 렌더링한 페이지를 다시 불러오지 않습니다.
+    readiness가 주어지면 기관의 과거 요소 등장 기록으로 대기 시간을 정하고, 이번 결과를 기록합니다.
     """
     try:
-        # URL 접속
-        driver.get(url)
-        logger.info(f"[SELENIUM] {url} 접속 성공")
+        # URL 접속 (같은 URL 그룹에서 연 페이지에 머물러 있으면 재사용)
+        reused = open_rendered_page(driver, url, page_cache)
+        if reused:
+            logger.info(f"[SELENIUM] {url} 렌더링된 페이지 재사용")
+        else:
+            logger.info(f"[SELENIUM] {url} 접속 성공")
+        # 재사용한 페이지는 등장 시간이 0에 가까우므로 기록하지 않음
+        stats = None if reused else readiness
+        timeout, frame_timeout, grace = wait_budget(readiness)
+        start = time.monotonic()
 
         # 요소 대기 및 찾기
-        elements = wait_and_find_elements(driver, selector, by, logger)
+        elements = wait_and_find_elements(driver, selector, by, logger, timeout=timeout, on_page=on_page, grace=grace)
         if elements:
+            record_appearance(stats, time.monotonic() - start, in_frame=False)
             return elements
 
         # iframe에서 요소 찾기
         logger.warning(f"[SELENIUM] {selector} 요소를 찾지 못함, iframe 탐색 시작")
-        elements = search_in_iframes(driver, selector, by, logger)
+        # iframe 등장 시간은 최상위 문서 대기 시간을 제외하고, 요소를 찾은 iframe 안에서의 대기 시간으로 기록
+        frame_appear = {}
+        elements = search_in_iframes(driver, selector, by, logger, on_page=on_page, timeout=frame_timeout, grace=grace,
+                                     appear=frame_appear)
         if elements:
+            record_appearance(stats, frame_appear["seconds"], in_frame=True)
             return elements
 
+        record_miss(stats)
         logger.warning(f"[SELENIUM] 요소 탐색 실패: {selector}")
+        # 선택자 수정 후 재검증할 수 있도록 실패한 페이지도 아카이브
+        if on_page:
+            on_page(driver.page_source, _method_name(by))
         return None
 
     except WebDriverException as e:
@@ -31,16 +59,38 @@ def fetch_elements_selenium(driver, url, selector, by, logger):
         return None
 
 
-def wait_and_find_elements(driver, selector, by, logger, timeout=7):
+def _elements_or_loaded(by, selector, start, grace):
+    """
+    WebDriverWait 조건: 요소가 있으면 요소 리스트를 반환하고,
+    grace초가 지난 뒤 문서 로드가 끝났는데도 요소가 없으면 "loaded"를 반환하여 대기를 일찍 끝냅니다.
+    """
+    def condition(driver):
+        elements = driver.find_elements(by, selector)
+        if elements:
+            return elements
+        if (time.monotonic() - start >= grace
+                and driver.execute_script("return document.readyState") == "complete"):
+            return "loaded"
+        return False
+    return condition
+
+def wait_and_find_elements(driver, selector, by, logger, timeout=DEFAULT_TIMEOUT, on_page=None, grace=None):
     """
     지정된 선택자로 요소를 대기하고 찾습니다.
+    grace가 주어지면 grace초 이후 문서 로드가 끝났는데 요소가 없을 때 timeout을 기다리지 않고 종료합니다.
+    요소를 찾으면 현재 문서(iframe 내부라면 해당 iframe)의 DOM을 on_page로 전달합니다.
     """
+    grace = timeout if grace is None else grace
     try:
-        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, selector)))
+        elements = WebDriverWait(driver, timeout).until(_elements_or_loaded(by, selector, time.monotonic(), grace))
+        if elements == "loaded":
+            logger.warning(f"[SELENIUM] 페이지 로드 완료, 요소 없음 (대기 조기 종료)")
+            return None
         logger.info(f"[SELENIUM] 요소 로드 성공")
-        elements = driver.find_elements(by, selector)
         if elements:
             logger.info(f"[SELENIUM] 요소 찾기 성공")
+            if on_page:
+                on_page(driver.page_source, _method_name(by))
             return elements
         return None
     except TimeoutException:
@@ -48,9 +98,10 @@ def wait_and_find_elements(driver, selector, by, logger, timeout=7):
         return None
 
 
-def search_in_iframes(driver, selector, by, logger):
+def search_in_iframes(driver, selector, by, logger, on_page=None, timeout=DEFAULT_FRAME_TIMEOUT, grace=None, appear=None):
     """
-    모든 iframe을 순회하여 요소를 찾습니다.
+    모든 iframe을 순회하여 요소를 찾습니다. (iframe별 대기 시간 timeout)
+    appear dict가 주어지면 요소를 찾은 iframe 안에서 기다린 시간을 appear["seconds"]에 기록합니다.
     """
     iframes = driver.find_elements(By.TAG_NAME, 'iframe')
     if not iframes:
@@ -61,11 +112,15 @@ def search_in_iframes(driver, selector, by, logger):
         try:
             driver.switch_to.frame(iframe)
             logger.info(f"[SELENIUM] IFrame 전환 성공")
-            elements = wait_and_find_elements(driver, selector, by, logger, timeout=3)
+            frame_start = time.monotonic()
+            elements = wait_and_find_elements(driver, selector, by, logger, timeout=timeout, on_page=on_page, grace=grace)
             if elements:
+                if appear is not None:
+                    appear["seconds"] = time.monotonic() - frame_start
                 return elements
             # 재귀적으로 내부 iframe 검색
-            elements = search_in_iframes(driver, selector, by, logger)
+            elements = search_in_iframes(driver, selector, by, logger, on_page=on_page, timeout=timeout, grace=grace,
+                                         appear=appear)
             if elements:
                 return elements
 
@@ -75,7 +130,7 @@ def search_in_iframes(driver, selector, by, logger):
             driver.switch_to.default_content() # IFrame 탐색 후 기본 콘텐츠로 복귀
     return None
 
-def selenium_crawling(driver, url, selector, by_type, logger):
+def selenium_crawling(driver, url, selector, by_type, logger, on_page=None, page_cache=None, readiness=None):
     """
     Selenium을 사용하여 요소를 추출하는 일반 함수.
     :param driver: Selenium WebDriver 인스턴스
@@ -83,6 +138,9 @@ def selenium_crawling(driver, url, selector, by_type, logger):
     :param selector: 선택자 (CSS 셀렉터 또는 클래스 이름)
     :param by_type: 선택자 유형 ('css' 또는 'class')
     :param logger: 로깅 객체
+    :param on_page: 렌더링된 DOM을 전달받을 콜백 (페이지 아카이브용)
+    :param page_cache: 같은 URL을 쓰는 기관들이 공유하는 페이지 캐시 (page_cache.new_page_cache)
+    :param readiness: 기관의 요소 등장 기록 (readiness.load_readiness의 기관별 항목)
     :return: 추출된 WebElement 리스트 또는 None
     """
     # 선택자 유형 매핑
@@ -97,4 +155,4 @@ def selenium_crawling(driver, url, selector, by_type, logger):
         return None
 
     # fetch_elements_selenium 호출
-    return fetch_elements_selenium(driver, url, selector, by_method, logger)
+    return fetch_elements_selenium(driver, url, selector, by_method, logger, on_page=on_page, page_cache=page_cache, readiness=readiness)
@@ -1,7 +1,15 @@
 import json
 import re
 import os
-from datetime import datetime
+import hashlib
+from datetime import datetime, timedelta
+
+# word_filter에 사용할 장학 관련 키워드
+FILTER_KEYWORDS = ['장학', '지원']
+
+# 기관별 항목 기록(history): 현재 목록에서 사라진 항목은 지문(64비트 해시)과 마지막 확인일만 보관
+HISTORY_MAX_ITEMS = 2000    # 기관별 최대 기록 수
+HISTORY_MAX_DAYS = 365      # 목록에서 사라진 뒤 보관 기간(일)
 
 def extract_element(elements):
     """
@@ -9,7 +17,9 @@ def extract_element(elements):
     """
     data = []
     for element in elements:
-        if hasattr(element, 'get_text'):  # BeautifulSoup 객체인 경우
+        if isinstance(element, str):  # 파싱 워커에서 이미 정리된 텍스트인 경우
+            cleaned_text = element
+        elif hasattr(element, 'get_text'):  # BeautifulSoup 객체인 경우
             cleaned_text = re.sub(r'\s+', ' ', element.get_text()).strip()
         elif hasattr(element, 'text'):  # Selenium WebElement 객체인 경우
             cleaned_text = re.sub(r'\s+', ' ', element.text).strip()
@@ -40,31 +50,88 @@ def word_filter(keywords, data_list):
 
     return passed_data, failed_data
 
+def item_fingerprint(item):
+    """
+    항목 텍스트의 지문(blake2b 64비트, 16자리 hex)을 반환합니다.
+    """
+    return hashlib.blake2b(item.encode('utf-8'), digest_size=8).hexdigest()
+
+def known_fingerprints(old_data):
+    """
+    기존 데이터의 현재 항목(data)과 기록(history)을 합친 지문 set을 반환합니다.
+    (history가 없는 이전 형식의 파일도 data만으로 비교)
+    """
+    return set(old_data.get("history", {})) | {item_fingerprint(item) for item in old_data.get("data", [])}
+
+def update_history(history, live_items, today=None):
+    """
+    현재 항목의 지문과 확인일을 기록하고, 기간(HISTORY_MAX_DAYS)과 개수(HISTORY_MAX_ITEMS)를 넘은 기록을 정리합니다.
+    현재 목록에 남아 있는 항목의 지문은 정리 대상에서 제외합니다.
+
+    :param history: 기존 기록 { 지문: 마지막 확인일 "YYYY-MM-DD" }
+    :param live_items: 현재 항목 텍스트 리스트
+    :return: 정리된 새 기록 dict
+    """
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    cutoff = (datetime.strptime(today, "%Y-%m-%d") - timedelta(days=HISTORY_MAX_DAYS)).strftime("%Y-%m-%d")
+    live = {item_fingerprint(item) for item in live_items}
+
+    merged = dict(history)
+    merged.update((fingerprint, today) for fingerprint in live)
+    # 날짜 문자열은 사전순 = 시간순. 현재 항목 우선, 그 다음 최근 확인 순으로 보관
+    kept = [(fingerprint, last_seen) for fingerprint, last_seen in merged.items()
+            if fingerprint in live or last_seen >= cutoff]
+    kept.sort(key=lambda pair: (pair[0] in live, pair[1]), reverse=True)
+    return dict(sorted(kept[:max(HISTORY_MAX_ITEMS, len(live))]))
+
 def extract_new_information(old_data, new_data):
     """
     기존 데이터와 새로운 데이터를 비교하여 새로운 정보만 추출합니다.
+    기존 항목은 현재 항목(data)과 과거 항목 지문(history)을 모두 포함합니다.
 
     :param old_data: 기존 데이터 (dict)
     :param new_data: 새로운 데이터 (dict)
     :return: 새로운 데이터만 포함한 dict
     """
-    old_items = set(old_data.get("data", []))  # 기존 데이터의 'data' 항목
-    new_items = set(new_data.get("data", []))  # 새로운 데이터의 'data' 항목
+    known = known_fingerprints(old_data)
 
-    # 새로운 데이터만 추출
-    unique_items = new_items - old_items
+    # 새로운 데이터만 추출 (수집 순서 유지, 중복 제거)
+    unique_items = [item for item in dict.fromkeys(new_data.get("data", []))
+                    if item_fingerprint(item) not in known]
 
     # 새로운 데이터의 구조 유지
     return {
         "method": new_data["method"],
         "by": new_data["by"],
         "last_update_date": new_data["last_update_date"],
-        "data": list(unique_items)
+        "data": unique_items
     }
 
+def load_known_items(save_path):
+    """
+    기관의 기존 수집 항목 지문을 불러옵니다. (페이지네이션 중단 조건 확인용, item_fingerprint로 비교)
+
+    :param save_path: JSON 파일 경로
+    :return: 기존 항목 지문 set, 파일이 없으면 빈 set
+    """
+    if not os.path.exists(save_path):
+        return set()
+    with open(save_path, 'r', encoding='utf-8') as f:
+        return known_fingerprints(json.load(f))
+
+def load_saved_method(save_path):
+    """
+    기관 데이터 파일에 기록된 마지막 크롤링 방식을 반환합니다. 파일이 없으면 None
+    """
+    if not os.path.exists(save_path):
+        return None
+    with open(save_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get("method")
+
 def save_data(data, save_path, method, selector_value, logger):
     """
     데이터를 JSON 파일로 저장하며 메타데이터를 포함합니다.
+    전체 텍스트는 현재 항목(data)만 저장하고, 과거 항목은 history에 지문과 마지막 확인일로 보관합니다.
 
     :param data: 저장할 데이터
     :param save_path: JSON 파일 경로
@@ -96,8 +163,13 @@ def save_data(data, save_path, method, selector_value, logger):
             return None  # 변경 사항이 없으면 None 반환
         else:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)  # 디렉토리 생성
+            # 내용이 같으면 파일을 갱신하지 않으므로, 기존 항목(data)은 이번 실행 직전까지 목록에 있었던 것으로 보고
+            # 오늘 날짜로 확인일을 갱신 (history가 없는 이전 형식 파일의 항목도 여기서 기록에 옮김)
+            today = new_data["last_update_date"][:10]
+            history = dict(old_data.get("history", {}))
+            history.update((item_fingerprint(item), today) for item in old_data.get("data", []))
             with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(new_data, f, ensure_ascii=False, indent=4)
+                json.dump({**new_data, "history": update_history(history, data, today)}, f, ensure_ascii=False, indent=4)
             if unique_data["data"]:
                 logger.info(f"[DATA] 새로운 데이터 '{len(unique_data['data'])}개' 발견!")
             logger.info(f"[DATA] 데이터가 업데이트되었습니다!")
@@ -0,0 +1,116 @@
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from src.crawler_manager import setup_driver
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 메모리 기준 재시작만 비활성화
+    psutil = None
+
+DEFAULT_MAX_PAGES = 200
+DEFAULT_MAX_MEMORY_MB = 1500
+
+class DriverSupervisor:
+    """
+    WebDriver를 감싸서 브라우저 상태를 관리합니다.
+
+    - 페이지 수(max_pages) 또는 브라우저 프로세스 트리 메모리(max_memory_mb)가 기준을 넘으면
+      기관 사이(recycle_if_needed)에서 브라우저를 재시작합니다.
+    - WebDriverException 이후 세션이 죽었으면 브라우저를 재시작하고 요청을 한 번 재시도합니다.
+
+    그 외의 속성은 현재 WebDriver로 그대로 위임하므로, 기존 코드에 driver 대신 넘길 수 있습니다.
+    여러 lane에서 공유하므로 사용하는 쪽에서 lock을 잡고 접근해야 합니다.
+    """
+
+    def __init__(self, logger, max_pages=DEFAULT_MAX_PAGES, max_memory_mb=DEFAULT_MAX_MEMORY_MB):
+        self.logger = logger
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.page_count = 0
+        self.restart_count = 0
+        self.lock = threading.RLock()
+        self._driver = setup_driver()
+
+    def __getattr__(self, name):
+        if name in ("_driver", "lock"):  # 초기화 실패 시 무한 재귀 방지
+            raise AttributeError(name)
+        return getattr(self._driver, name)
+
+    def get(self, url):
+        """
+        URL에 접속합니다. 세션이 죽어 실패한 경우 브라우저를 재시작하고 한 번 재시도합니다.
+        """
+        self.page_count += 1
+        try:
+            return self._driver.get(url)
+        except WebDriverException:
+            if self.is_alive():
+                raise
+            self.restart("세션 종료 감지")
+            self.page_count += 1
+            return self._driver.get(url)
+
+    def is_alive(self):
+        """
+        WebDriver 세션이 응답하는지 확인합니다.
+        """
+        try:
+            self._driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def memory_mb(self):
+        """
+        chromedriver와 하위 브라우저 프로세스들의 RSS 합계(MB)를 반환합니다.
+        psutil이 없거나 측정할 수 없으면 None을 반환합니다.
+        """
+        if psutil is None:
+            return None
+        try:
+            root = psutil.Process(self._driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+        except (psutil.Error, AttributeError):
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue  # 측정 도중 종료된 프로세스
+        return total / (1024 * 1024)
+
+    def recycle_if_needed(self):
+        """
+        기관 처리 사이에 호출하여, 세션이 죽었거나 기준을 넘었으면 브라우저를 재시작합니다.
+        """
+        try:
+            if not self.is_alive():
+                self.restart("세션 응답 없음")
+            elif self.page_count >= self.max_pages:
+                self.restart(f"페이지 수 {self.page_count}회 도달")
+            else:
+                memory = self.memory_mb()
+                if memory is not None and memory >= self.max_memory_mb:
+                    self.restart(f"메모리 {memory:.0f}MB 사용")
+        except Exception as e:
+            # 재시작에 실패해도 크롤링은 계속 진행 (다음 기관에서 다시 시도)
+            self.logger.error(f"[DRIVER] 재시작 실패: {type(e).__name__} - {e}")
+
+    def restart(self, reason):
+        """
+        현재 브라우저를 종료하고 새로 생성합니다.
+        """
+        self.logger.warning(f"[DRIVER] WebDriver 재시작 ({reason})")
+        try:
+            self._driver.quit()
+        except Exception as e:
+            self.logger.error(f"[DRIVER] 기존 WebDriver 종료 중 오류 발생: {e}")
+        self._driver = setup_driver()
+        self.page_count = 0
+        self.restart_count += 1
+
+    def quit(self):
+        self._driver.quit()
@@ -0,0 +1,174 @@
+import json
+import os
+import re
+import time
+import xml.etree.ElementTree as ElementTree
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+
+from src.charset_resolver import resolve_and_decode
+
+FEEDS_DIR = os.path.join("data", "cache")
+DEFAULT_RECHECK_DAYS = 30   # 피드가 없던 기관의 재탐색 주기
+MAX_FEED_FAILURES = 3       # 연속 실패 시 피드를 해제하고 HTML 크롤링으로 복귀
+MIN_FEED_OVERLAP = 0.5      # 피드 등록에 필요한, HTML 수집 항목과 겹치는 제목 비율
+MIN_TITLE_LENGTH = 4        # 겹침 비교에 사용할 최소 제목 길이 ("공지" 등 짧은 제목 제외)
+
+_FEED_TYPES = ("application/rss+xml", "application/atom+xml", "application/feed+xml")
+
+def _feeds_path(config_key):
+    return os.path.join(FEEDS_DIR, f"{config_key}_feeds.json")
+
+def load_feeds(config_key):
+    """
+    기관별 피드 정보를 불러옵니다.
+
+    :return: { org_name: {"feed_url", "etag", "last_modified", "checked_at", "failures"} }
+    """
+    path = _feeds_path(config_key)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_feeds(config_key, feeds, logger):
+    """
+    기관별 피드 정보를 저장합니다.
+    """
+    try:
+        os.makedirs(FEEDS_DIR, exist_ok=True)
+        with open(_feeds_path(config_key), 'w', encoding='utf-8') as f:
+            json.dump(feeds, f, ensure_ascii=False, indent=4, sort_keys=True)
+    except Exception as e:
+        logger.error(f"[FEED] 피드 정보 저장 중 오류 발생: {e}")
+
+def needs_discovery(feed, recheck_days=DEFAULT_RECHECK_DAYS):
+    """
+    피드 탐색이 필요한지 확인합니다. (탐색한 적이 없거나, 피드가 없고 재탐색 주기가 지난 경우)
+    """
+    if not feed:
+        return True
+    if feed.get("feed_url"):
+        return False
+    return time.time() - feed.get("checked_at", 0) >= recheck_days * 86400
+
+def parse_feed_items(content, content_type=None):
+    """
+    RSS/Atom 피드에서 항목 제목을 추출합니다. (네임스페이스와 무관하게 item/entry의 title)
+    ElementTree는 EUC-KR 등 멀티바이트 인코딩을 직접 파싱하지 못하므로 먼저 문자열로 디코딩합니다.
+
+    :param content: 피드 본문 (bytes)
+    :param content_type: HTTP Content-Type 헤더 값
+    :return: 정리된 제목 리스트
+    """
+    text, _, _ = resolve_and_decode(content, content_type)
+    root = ElementTree.fromstring(text)
+    items = []
+    for element in root.iter():
+        if element.tag.rsplit('}', 1)[-1] not in ("item", "entry"):
+            continue
+        for child in element:
+            if child.tag.rsplit('}', 1)[-1] == "title":
+                title = re.sub(r'\s+', ' ', "".join(child.itertext())).strip()
+                if title:
+                    items.append(title)
+                break
+    return items
+
+def discover_feed_urls(content, base_url):
+    """
+    HTML 페이지에서 RSS/Atom 피드 후보 URL을 찾습니다.
+    (<link rel="alternate" type="application/rss+xml"> 우선, 그 다음 href/텍스트에 rss가 포함된 링크)
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    candidates = []
+    for link in soup.find_all("link", href=True):
+        if (link.get("type") or "").lower() in _FEED_TYPES:
+            candidates.append(urljoin(base_url, link["href"]))
+    for anchor in soup.find_all("a", href=True):
+        href = anchor["href"]
+        if href.startswith(("#", "javascript:")):
+            continue
+        if "rss" in href.lower() or anchor.get_text(strip=True).lower() == "rss":
+            candidates.append(urljoin(base_url, href))
+    return list(dict.fromkeys(candidates))  # 순서 유지 중복 제거
+
+def feed_overlap(titles, data):
+    """
+    피드 제목 중 HTML에서 수집한 항목과 겹치는 비율을 계산합니다.
+    (항목 텍스트에 제목이 포함되거나 그 반대인 경우 겹치는 것으로 봄, 작성자·날짜가 함께 추출된 행 대응)
+
+    :return: 겹치는 제목 수 / min(제목 수, 항목 수), 비교할 수 없으면 0
+    """
+    titles = [title for title in titles if len(title) >= MIN_TITLE_LENGTH]
+    data = [item for item in data if len(item) >= MIN_TITLE_LENGTH]
+    if not titles or not data:
+        return 0
+    matched = sum(1 for title in titles if any(title in item or item in title for item in data))
+    return matched / min(len(titles), len(data))
+
+def discover_feed(org_name, url, content, data, feeds, logger):
+    """
+    페이지에서 피드 후보를 찾아, 제목이 HTML에서 수집한 항목(data)과 충분히 겹치는 피드만 기관 피드로 등록합니다.
+    (사이트 전체 뉴스 피드나 다른 게시판 피드가 장학 게시판을 대체하지 않도록)
+    등록된 피드는 다음 실행부터 HTML 크롤링 대신 사용됩니다.
+    """
+    feed = {"feed_url": None, "checked_at": time.time()}
+    for candidate in discover_feed_urls(content, url) if content else []:
+        try:
+            res = requests.get(candidate, timeout=10)
+            res.raise_for_status()
+            overlap = feed_overlap(parse_feed_items(res.content, res.headers.get("Content-Type")), data)
+            if overlap >= MIN_FEED_OVERLAP:
+                # ETag는 저장하지 않음: 첫 피드 요청에서 전체 항목을 받아 기준 데이터로 저장
+                feed.update({"feed_url": candidate, "failures": 0})
+                logger.info(f"[FEED] {org_name} 피드 등록: {candidate} (겹침 {overlap:.0%})")
+                break
+            logger.debug(f"[FEED] 게시판 항목과 겹치지 않는 피드 제외: {candidate} (겹침 {overlap:.0%})")
+        except (requests.exceptions.RequestException, ElementTree.ParseError, ValueError) as e:
+            logger.debug(f"[FEED] 피드 후보 검증 실패: {candidate} ({e})")
+    feeds[org_name] = feed
+
+def fetch_feed(feed, logger):
+    """
+    등록된 피드를 조건부 GET(ETag / Last-Modified)으로 가져옵니다.
+    연속 MAX_FEED_FAILURES회 실패하면 피드를 해제합니다.
+
+    :return: (항목 리스트, 변경 없음 여부) - 실패 시 (None, False)
+    """
+    headers = {}
+    if feed.get("etag"):
+        headers["If-None-Match"] = feed["etag"]
+    if feed.get("last_modified"):
+        headers["If-Modified-Since"] = feed["last_modified"]
+
+    try:
+        res = requests.get(feed["feed_url"], headers=headers, timeout=10)
+        if res.status_code == 304:
+            logger.info("[FEED] 피드 변경 없음 (304)")
+            feed["failures"] = 0
+            return None, True
+        res.raise_for_status()
+        items = parse_feed_items(res.content, res.headers.get("Content-Type"))
+        if not items:
+            raise ValueError("피드 항목이 비어 있습니다.")
+    except (requests.exceptions.RequestException, ElementTree.ParseError, ValueError) as e:
+        feed["failures"] = feed.get("failures", 0) + 1
+        logger.warning(f"[FEED] 피드 요청 실패 ({feed['failures']}회): {e}")
+        if feed["failures"] >= MAX_FEED_FAILURES:
+            logger.warning(f"[FEED] 피드 해제, HTML 크롤링으로 복귀: {feed['feed_url']}")
+            feed.update({"feed_url": None, "etag": None, "last_modified": None, "checked_at": time.time()})
+        return None, False
+
+    feed.update({
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "failures": 0,
+    })
+    logger.info(f"[FEED] 피드 항목 {len(items)}개 수신")
+    return items, False
@@ -1,12 +1,91 @@
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
 import os
+import queue
+from contextlib import contextmanager
 from datetime import datetime
 
 current_date = datetime.now().strftime("%Y-%m-%d")
 
+# 환경 변수로 로그 형식/양 조절
+#   LOG_FORMAT=json      : 파일 로그를 JSON Lines 형식으로 저장 (org, method, stage 필드 포함)
+#   LOG_VOLUME=compact   : 기관별 경계선을 한 줄로 줄이고, 크롤링 메서드 내부의 INFO 로그는 생략
+#   LOG_BUFFER=100       : 파일 핸들러 버퍼 크기 (ERROR 이상은 즉시 기록)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+LOG_VOLUME = os.getenv("LOG_VOLUME", "full")
+LOG_BUFFER = int(os.getenv("LOG_BUFFER", "100"))
+
+# 로그 레코드에 붙는 구조화 필드
+LOG_FIELDS = ("org", "method", "stage")
+
+_log_context = contextvars.ContextVar("log_context", default={})
+_listeners = {}  # { sub_dir: (QueueListener, QueueHandler) }
+
+def set_log_context(**fields):
+    """
+    현재 실행 흐름(스레드)의 로그 컨텍스트 필드(org, method, stage)를 갱신합니다.
+    """
+    _log_context.set({**_log_context.get(), **fields})
+
+@contextmanager
+def log_context(**fields):
+    """
+    with 블록 안에서만 로그 컨텍스트 필드를 적용합니다.
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+class ContextFilter(logging.Filter):
+    """
+    로그 레코드에 컨텍스트 필드를 채우고, LOG_VOLUME=compact일 때 메서드 내부의 상세 로그를 걸러냅니다.
+    QueueHandler에 붙어 크롤링 스레드에서 실행되므로, 걸러진 로그는 큐에 들어가지 않습니다.
+    """
+    def filter(self, record):
+        context = _log_context.get()
+        for field in LOG_FIELDS:
+            if not hasattr(record, field):
+                setattr(record, field, context.get(field))
+        if LOG_VOLUME == "compact" and record.method and record.levelno < logging.WARNING:
+            return False
+        return True
+
+class TextFormatter(logging.Formatter):
+    """
+    텍스트 로그 포매터. lane이 동시에 실행되어 로그가 섞이므로, 기관명(org)이 있으면 메시지 앞에 [기관명]을 붙입니다.
+    """
+    def format(self, record):
+        org = getattr(record, "org", None)
+        record.org_tag = f"[{org}] " if org else ""
+        return super().format(record)
+
+class JsonLineFormatter(logging.Formatter):
+    """
+    로그 레코드를 한 줄짜리 JSON으로 변환합니다.
+    """
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for field in LOG_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
 def setup_logging(sub_dir):
     """
     주어진 서브 디렉토리(logs/{sub_dir})에 로그를 설정합니다.
+    로거에는 QueueHandler만 연결하고, 실제 출력(콘솔/파일)은 QueueListener 스레드에서 처리합니다.
     """
      # 기존 로거 초기화 여부 확인
     if sub_dir in logging.Logger.manager.loggerDict:
@@ -15,7 +94,7 @@ def setup_logging(sub_dir):
 
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    
+
     # 로그 디렉토리 생성
     base_dir = "logs"
     log_dir = os.path.join(base_dir, sub_dir)
@@ -32,42 +111,73 @@ def setup_logging(sub_dir):
     # 기존 핸들러 제거 (중복 방지)
     if logger.hasHandlers():
         logger.handlers.clear()
-    
+
     # 포매터 설정
-    formatter = logging.Formatter('[%(levelname)s] %(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    
+    formatter = TextFormatter('[%(levelname)s] %(asctime)s - %(org_tag)s%(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    file_formatter = JsonLineFormatter(datefmt='%Y-%m-%d %H:%M:%S') if LOG_FORMAT == "json" else formatter
+    log_ext = "jsonl" if LOG_FORMAT == "json" else "log"
+
     # 로그 파일 경로 설정
-    info_log_file = os.path.join(daily_dir, f"info_{current_time}.log")
-    error_log_file = os.path.join(daily_dir, f"error_{current_time}.log")
+    info_log_file = os.path.join(daily_dir, f"info_{current_time}.{log_ext}")
+    error_log_file = os.path.join(daily_dir, f"error_{current_time}.{log_ext}")
 
    # StreamHandler 설정 (콘솔 출력)
     stream_handler = logging.StreamHandler()
     stream_handler.setLevel(logging.INFO)
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
 
-    # FileHandler 설정 (INFO 레벨 로그 저장)
+    # FileHandler 설정 (INFO 레벨 로그 저장, LOG_BUFFER개 단위로 버퍼링)
     info_file_handler = logging.FileHandler(info_log_file, encoding='utf-8')
-    info_file_handler.setLevel(logging.INFO)
-    info_file_handler.setFormatter(formatter)
-    logger.addHandler(info_file_handler)
+    info_file_handler.setFormatter(file_formatter)
+    info_buffer_handler = logging.handlers.MemoryHandler(LOG_BUFFER, flushLevel=logging.ERROR, target=info_file_handler)
+    info_buffer_handler.setLevel(logging.INFO)
 
     # FileHandler 설정 (ERROR 레벨 로그 저장)
     error_file_handler = logging.FileHandler(error_log_file, encoding='utf-8')
-    error_file_handler.setLevel(logging.ERROR)
-    error_file_handler.setFormatter(formatter)
-    logger.addHandler(error_file_handler)
+    error_file_handler.setFormatter(file_formatter)
+    error_buffer_handler = logging.handlers.MemoryHandler(LOG_BUFFER, flushLevel=logging.ERROR, target=error_file_handler)
+    error_buffer_handler.setLevel(logging.ERROR)
+
+    # QueueHandler → QueueListener(별도 스레드) → 콘솔/파일 핸들러
+    handlers = [stream_handler, info_buffer_handler, error_buffer_handler]
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    logger.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[sub_dir] = (listener, queue_handler)
+    atexit.register(shutdown_logging, logger)
 
     # 디버깅 출력
-    print(f"[DEBUG] 현재 로거 '{sub_dir}'의 핸들러 수: {len(logger.handlers)}")
-    for handler in logger.handlers:
+    print(f"[DEBUG] 현재 로거 '{sub_dir}'의 핸들러 수: {len(handlers)} (QueueListener)")
+    for handler in handlers:
         print(f"[DEBUG] 핸들러: {handler}")
     print(f"[DEBUG] ({sub_dir}) INFO 로그 파일: {info_log_file}")
     print(f"[DEBUG] ({sub_dir}) ERROR 로그 파일: {error_log_file}")
-    
+
     return logger
 
+def shutdown_logging(logger):
+    """
+    QueueListener를 종료하여 큐에 남은 로그와 파일 버퍼를 모두 기록합니다.
+    이후의 로그는 로거에 직접 연결된 핸들러로 동기 기록됩니다.
+    """
+    if logger.name not in _listeners:
+        return
+    listener, queue_handler = _listeners.pop(logger.name)
+    listener.stop()
+    logger.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        handler.flush()
+        handler.addFilter(ContextFilter())
+        logger.addHandler(handler)
+
 def log_with_border(message, logger, width=50):
+    # LOG_VOLUME=compact이면 한 줄로 기록
+    if LOG_VOLUME == "compact":
+        logger.info(f"== {message} ==")
+        return
     border = "=" * width
     # 메시지 길이에 따라 중앙 정렬
     padded_message = f"{message}".center(width)
@@ -81,4 +191,4 @@ def log_with_border(message, logger, width=50):
 # # 테스트 로그
 # logger.debug("This is a DEBUG message.")   # 콘솔 및 파일 저장
 # logger.info("This is an INFO message.")    # 콘솔 및 파일 저장
-# logger.error("This is an ERROR message.")  # 콘솔, 파일1, 파일2 저장
\ No newline at end of file
+# logger.error("This is an ERROR message.")  # 콘솔, 파일1, 파일2 저장
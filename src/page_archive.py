@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import zstandard
+except ImportError:  # 아카이브는 선택 기능이므로 zstandard가 없으면 비활성화
+    zstandard = None
+
+ARCHIVE_BASE_DIR = "archive"
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_MB = 500
+
+def setup_archive(config_key, archive_config, logger):
+    """
+    페이지 아카이브를 초기화합니다. (archive/{config_key})
+
+    :param config_key: "univ" 또는 "nonuniv" 설정 키
+    :param archive_config: db_config의 "archive" 항목 (enabled, max_age_days, max_mb)
+    :param logger: 로깅 객체
+    :return: 아카이브 dict, 비활성화 상태면 None
+    """
+    if not archive_config or not archive_config.get("enabled"):
+        return None
+    if zstandard is None:
+        logger.warning("[ARCHIVE] zstandard 패키지가 없어 아카이브를 비활성화합니다.")
+        return None
+
+    base_dir = os.path.join(ARCHIVE_BASE_DIR, config_key)
+    os.makedirs(os.path.join(base_dir, "objects"), exist_ok=True)
+    index_path = os.path.join(base_dir, "index.json")
+    index = {}
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"[ARCHIVE] 인덱스 로드 실패, 새로 생성합니다: {e}")
+
+    return {
+        "base_dir": base_dir,
+        "index_path": index_path,
+        "index": index,  # { org_name: [ {hash, url, method, kind, fetched_at, size}, ... ] }
+        "max_age_days": archive_config.get("max_age_days", DEFAULT_MAX_AGE_DAYS),
+        "max_bytes": archive_config.get("max_mb", DEFAULT_MAX_MB) * 1024 * 1024,
+        "lock": threading.Lock(),  # 여러 lane에서 동시에 기록
+    }
+
+def _object_path(archive, content_hash):
+    return os.path.join(archive["base_dir"], "objects", content_hash[:2], f"{content_hash}.zst")
+
+def archive_page(archive, org_name, url, method, content, kind="raw"):
+    """
+    가져온 페이지 본문을 zstd로 압축하여 내용 주소(sha256) 기반으로 저장합니다.
+    동일한 페이지는 한 번만 저장되고, 기관별 인덱스에 기록만 추가됩니다.
+
+    :param archive: setup_archive가 반환한 아카이브 dict
+    :param org_name: 기관명
+    :param url: 요청 URL
+    :param method: 페이지를 가져온 크롤링 방식 (ex: bs4_css, selenium_css)
+    :param content: 페이지 본문 (bytes 또는 str)
+    :param kind: "raw" (HTTP 응답 원본) 또는 "dom" (Selenium 렌더링 결과, UTF-8)
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    object_path = _object_path(archive, content_hash)
+    if not os.path.exists(object_path):
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        compressed = zstandard.ZstdCompressor(level=10).compress(content)
+        tmp_path = f"{object_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, object_path)
+
+    with archive["lock"]:
+        return _add_index_entry(archive, org_name, url, method, kind, content_hash, os.path.getsize(object_path))
+
+def _add_index_entry(archive, org_name, url, method, kind, content_hash, size):
+    fetched_at = time.time()
+    entries = archive["index"].setdefault(org_name, [])
+    # 같은 방식으로 같은 페이지를 다시 가져온 경우 시각만 갱신
+    for entry in entries:
+        if entry["hash"] == content_hash and entry["method"] == method:
+            entry["fetched_at"] = fetched_at
+            entry["url"] = url
+            return content_hash
+    entries.append({
+        "hash": content_hash,
+        "url": url,
+        "method": method,
+        "kind": kind,
+        "fetched_at": fetched_at,
+        "size": size,
+    })
+    return content_hash
+
+def make_page_hook(archive, org_name, url, logger):
+    """
+    크롤링 메서드에 넘길 on_page 콜백을 생성합니다.
+    Selenium 방식이 전달한 페이지는 렌더링된 DOM("dom")으로 기록합니다.
+    아카이브 저장 실패는 크롤링에 영향을 주지 않도록 로그만 남깁니다.
+    """
+    def on_page(content, method):
+        kind = "dom" if method.startswith("selenium") else "raw"
+        try:
+            archive_page(archive, org_name, url, method, content, kind=kind)
+        except Exception as e:
+            logger.error(f"[ARCHIVE] {org_name} 페이지 저장 중 오류 발생: {e}")
+    return on_page
+
+def load_page(archive, entry):
+    """
+    인덱스 항목에 해당하는 페이지 본문(bytes)을 읽어 압축을 해제합니다.
+    """
+    with open(_object_path(archive, entry["hash"]), 'rb') as f:
+        return zstandard.ZstdDecompressor().decompress(f.read())
+
+def latest_entries(archive):
+    """
+    기관별로 가장 최근에 가져온 인덱스 항목을 반환합니다.
+
+    :return: { org_name: entry }
+    """
+    return {
+        org_name: max(entries, key=lambda entry: entry["fetched_at"])
+        for org_name, entries in archive["index"].items() if entries
+    }
+
+def evict_archive(archive, logger):
+    """
+    보관 기간(max_age_days)이 지난 항목을 제거하고, 전체 용량이 max_mb를 넘으면
+    오래된 항목부터 제거합니다. 기관별 최신 항목은 마지막까지 남겨 둡니다.
+    더 이상 참조되지 않는 압축 파일은 삭제합니다.
+    """
+    index = archive["index"]
+    cutoff = time.time() - archive["max_age_days"] * 86400
+    for org_name in list(index):
+        index[org_name] = [entry for entry in index[org_name] if entry["fetched_at"] >= cutoff]
+        if not index[org_name]:
+            del index[org_name]
+
+    # 용량 초과 시 오래된 항목부터 제거 (기관별 최신 항목은 후순위)
+    latest = {id(entry) for entry in latest_entries(archive).values()}
+    sizes = {}
+    for entries in index.values():
+        for entry in entries:
+            sizes[entry["hash"]] = entry["size"]
+    total_bytes = sum(sizes.values())
+    if total_bytes > archive["max_bytes"]:
+        candidates = sorted(
+            ((org_name, entry) for org_name, entries in index.items() for entry in entries),
+            key=lambda pair: (id(pair[1]) in latest, pair[1]["fetched_at"])
+        )
+        for org_name, entry in candidates:
+            if total_bytes <= archive["max_bytes"]:
+                break
+            index[org_name].remove(entry)
+            if not any(e["hash"] == entry["hash"] for entries in index.values() for e in entries):
+                total_bytes -= entry["size"]
+        for org_name in [name for name, entries in index.items() if not entries]:
+            del index[org_name]
+
+    # 참조되지 않는 압축 파일 삭제
+    referenced = {entry["hash"] for entries in index.values() for entry in entries}
+    removed = 0
+    objects_dir = os.path.join(archive["base_dir"], "objects")
+    for root, _, files in os.walk(objects_dir):
+        for file_name in files:
+            if file_name.endswith(".zst") and file_name[:-4] not in referenced:
+                os.remove(os.path.join(root, file_name))
+                removed += 1
+    if removed:
+        logger.info(f"[ARCHIVE] 만료된 페이지 {removed}개 삭제")
+
+def save_archive_index(archive, logger):
+    """
+    아카이브 인덱스를 정리(evict)한 뒤 파일로 저장합니다.
+    """
+    try:
+        evict_archive(archive, logger)
+        tmp_path = f"{archive['index_path']}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(archive["index"], f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, archive["index_path"])
+        logger.info(f"[ARCHIVE] 인덱스 저장 완료 ({len(archive['index'])}개 기관)")
+    except Exception as e:
+        logger.error(f"[ARCHIVE] 인덱스 저장 중 오류 발생: {e}")
@@ -0,0 +1,84 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def normalize_url(url):
+    """
+    같은 게시판을 가리키는 URL을 하나로 묶기 위해 정규화합니다.
+    (scheme/host 소문자, 기본 포트·fragment·경로 끝 슬래시 제거, 쿼리 파라미터 정렬)
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ""))
+
+def group_rows_by_url(rows, column_indices):
+    """
+    정규화한 URL이 같은 DB 행들을 하나의 그룹으로 묶습니다. (URL이 없는 행은 각각 단독 그룹)
+    같은 그룹의 기관들은 한 lane에서 연속으로 처리되어 페이지를 한 번만 가져옵니다.
+
+    :param rows: [(idx, row), ...]
+    :return: [[(idx, row), ...], ...] - 그룹 순서와 그룹 내 순서는 원래 행 순서를 따름
+    """
+    groups = {}
+    for idx, row in rows:
+        key = normalize_url(row[column_indices["url"]]) or ("no-url", idx)
+        groups.setdefault(key, []).append((idx, row))
+    return list(groups.values())
+
+def new_page_cache():
+    """
+    URL 그룹 하나에서 공유하는 페이지 캐시를 생성합니다.
+
+    - responses: { 정규화 URL: requests 응답 또는 요청 중 발생한 예외 }
+    - rendered: (정규화 URL, 접속 후 driver.current_url) - Selenium이 마지막으로 연 페이지
+    """
+    return {"responses": {}, "rendered": None}
+
+def fetch_page(url, page_cache=None):
+    """
+    URL을 requests로 가져옵니다. page_cache가 주어지면 같은 그룹 안에서는 한 번만 요청하고,
+    실패한 요청도 같은 예외를 다시 발생시켜 그룹의 다른 기관이 재요청하지 않도록 합니다.
+
+    :return: requests 응답 (raise_for_status 통과)
+    """
+    if page_cache is None:
+        res = requests.get(url, timeout=10)
+        res.raise_for_status()
+        return res
+
+    key = normalize_url(url)
+    if key not in page_cache["responses"]:
+        try:
+            res = requests.get(url, timeout=10)
+            res.raise_for_status()
+            page_cache["responses"][key] = res
+        except Exception as e:
+            page_cache["responses"][key] = e
+    cached = page_cache["responses"][key]
+    if isinstance(cached, Exception):
+        raise cached
+    return cached
+
+def open_rendered_page(driver, url, page_cache=None):
+    """
+    Selenium으로 URL에 접속합니다. 같은 그룹에서 이미 연 페이지에 브라우저가 그대로 머물러 있으면
+    (다른 lane이나 다음 페이지 탐색으로 이동하지 않았으면) 다시 접속하지 않습니다.
+
+    :return: 기존 페이지를 재사용했으면 True
+    """
+    key = normalize_url(url)
+    if page_cache is not None and page_cache["rendered"] == (key, driver.current_url):
+        return True
+    driver.get(url)
+    if page_cache is not None:
+        page_cache["rendered"] = (key, driver.current_url)
+    return False
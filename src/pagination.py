@@ -0,0 +1,118 @@
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from src.crawler_manager import perform_crawling
+from src.data_handler import extract_element, item_fingerprint
+
+DEFAULT_MAX_PAGES = 5
+
+def get_pagination(row, column_indices, default_max_pages=DEFAULT_MAX_PAGES, logger=None):
+    """
+    DB 행에서 기관별 페이지네이션 설정을 읽습니다.
+    (db_config "columns"에 page_url / next_selector / max_pages 컬럼이 매핑된 경우에만)
+
+    - page_url: 2페이지 이후의 URL 템플릿 (ex: https://.../list?page={page})
+    - next_selector: "다음 페이지" 링크의 CSS 셀렉터
+    - max_pages: 최대 탐색 페이지 수
+
+    :return: 페이지네이션 설정 dict, 설정이 없으면 None
+    """
+    def column(key):
+        return row[column_indices[key]] if key in column_indices else None
+
+    page_url, next_selector = column("page_url"), column("next_selector")
+    if not page_url and not next_selector:
+        return None
+
+    max_pages = column("max_pages")
+    try:
+        max_pages = int(max_pages or default_max_pages)
+    except (TypeError, ValueError):
+        if logger:
+            logger.warning(f"[PAGINATION] 잘못된 max_pages 값 '{max_pages}', 기본값 {default_max_pages} 사용")
+        max_pages = default_max_pages
+    return {
+        "page_url": page_url,
+        "next_selector": next_selector,
+        "max_pages": max_pages,
+    }
+
+def track_last_page(on_page=None):
+    """
+    크롤링 메서드가 마지막으로 가져온 페이지를 기록하는 on_page 콜백을 생성합니다.
+    기존 콜백(페이지 아카이브 등)이 있으면 1페이지에 대해서만 함께 호출합니다.
+
+    :return: (on_page 콜백, 마지막 페이지 dict {"content", "page"})
+    """
+    last_page = {"content": None, "page": 1}
+
+    def hook(content, method):
+        last_page["content"] = content
+        if on_page and last_page["page"] == 1:
+            on_page(content, method)
+    return hook, last_page
+
+def find_next_url(content, next_selector, base_url):
+    """
+    페이지 본문에서 "다음 페이지" 링크를 찾아 절대 URL로 반환합니다.
+    """
+    if not content:
+        return None
+    link = BeautifulSoup(content, 'html.parser').select_one(next_selector)
+    href = link.get("href") if link else None
+    if not href or href.startswith(("#", "javascript:")):
+        return None
+    return urljoin(base_url, href)
+
+def crawl_next_pages(method_name, method_func, method_args, url, data, pagination, known_items, last_page, logger):
+    """
+    페이지의 마지막(가장 오래된) 항목이 이미 아는 항목이 될 때까지 다음 페이지를 이어서 크롤링합니다. (최대 max_pages 페이지)
+    상단 고정 공지는 매 페이지 반복되고 항상 기존 항목이므로, "아는 항목이 하나라도 있는지"가 아니라
+    마지막 항목으로 판단하고, 2페이지부터는 앞 페이지에서 이미 나온(반복되는) 항목을 제외합니다.
+
+    :param method_args: 1페이지 크롤링에 사용한 인자 (url만 페이지별로 교체)
+    :param data: 1페이지에서 추출한 데이터
+    :param pagination: get_pagination이 반환한 설정
+    :param known_items: 기관의 기존 수집 항목 지문 (load_known_items)
+    :param last_page: track_last_page가 반환한 마지막 페이지 dict
+    :return: 모든 페이지의 데이터를 합친 리스트
+    """
+    # 첫 수집이면 비교할 기록이 없으므로 1페이지만 사용
+    if not known_items:
+        return data
+
+    def reached_known(items):
+        items = [item for item in items if item]
+        return bool(items) and item_fingerprint(items[-1]) in known_items
+
+    collected, seen = list(data), set(data)
+    page_data, page_url = data, url
+    for page in range(2, pagination["max_pages"] + 1):
+        if reached_known(page_data):
+            break
+
+        if pagination["page_url"]:
+            next_url = pagination["page_url"].format(page=page)
+        else:
+            next_url = find_next_url(last_page["content"], pagination["next_selector"], page_url)
+        if not next_url or next_url == page_url:
+            break
+
+        logger.info(f"[PAGINATION] {page}페이지 탐색: {next_url}")
+        page_args = [next_url if arg == url else arg for arg in method_args]
+        last_page["page"] = page
+        elements = perform_crawling(method_func, method_name, *page_args, logger=logger)
+        if not elements:
+            break
+        # 앞 페이지에서 나온 항목(상단 고정 공지 등)은 제외
+        page_data = [item for item in extract_element(elements) if item not in seen]
+        if not page_data:  # 마지막 페이지를 넘어 같은 목록이 반복되는 경우
+            break
+        collected.extend(page_data)
+        seen.update(page_data)
+        page_url = next_url
+        if page == pagination["max_pages"] and not reached_known(page_data):
+            logger.warning(f"[PAGINATION] 최대 {page}페이지까지 기존 항목을 찾지 못했습니다.")
+
+    return collected
@@ -0,0 +1,104 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from src.logging_config import current_date
+
+PROFILE_ENV = "SCRAPER_PROFILE"
+DEFAULT_MIN_SECONDS = 10.0    # 이 시간 이상 걸린 기관만 프로파일 저장
+DEFAULT_MIN_MEMORY_MB = 50.0  # 또는 이 이상 메모리를 추가로 사용한 기관
+TOP_FUNCTIONS = 30
+
+def profiling_requested(flag=False):
+    """
+    --profile 플래그 또는 환경 변수 SCRAPER_PROFILE=1로 프로파일링이 요청되었는지 확인합니다.
+    """
+    return flag or os.getenv(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+def setup_profiler(config_key, profile_config, logger):
+    """
+    기관별 프로파일링을 준비합니다. 결과는 logs/{config_key}/{date}/profiles/에 저장됩니다.
+    cProfile은 한 번에 하나만 활성화할 수 있으므로, 프로파일링 중에는 lane을 순차 실행해야 합니다.
+
+    :param profile_config: db_config의 "profile" 항목 (min_seconds, min_memory_mb)
+    :return: 프로파일러 dict
+    """
+    profile_config = profile_config or {}
+    profile_dir = os.path.join("logs", config_key, current_date, "profiles")
+    os.makedirs(profile_dir, exist_ok=True)
+    tracemalloc.start()
+    logger.info(f"[PROFILE] 프로파일링 모드 (저장 경로: {profile_dir})")
+    return {
+        "dir": profile_dir,
+        "min_seconds": profile_config.get("min_seconds", DEFAULT_MIN_SECONDS),
+        "min_memory_mb": profile_config.get("min_memory_mb", DEFAULT_MIN_MEMORY_MB),
+        "kept": [],        # [(org_name, 소요 시간, 메모리 MB), ...]
+        "hot": {},         # { (파일, 줄, 함수): 자체 실행 시간 합계 }
+        "logger": logger,
+    }
+
+@contextmanager
+def profile_org(profiler, org_name):
+    """
+    기관 하나의 처리 과정을 cProfile과 tracemalloc으로 측정합니다.
+    소요 시간 또는 메모리가 기준을 넘은 기관만 .prof / .txt 파일로 저장하고 요약에 반영합니다.
+    profiler가 None이면 아무 것도 하지 않습니다.
+    """
+    if profiler is None:
+        yield
+        return
+
+    tracemalloc.reset_peak()
+    base_memory, _ = tracemalloc.get_traced_memory()
+    profile = cProfile.Profile()
+    start = time.monotonic()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        duration = time.monotonic() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        memory_mb = (peak_memory - base_memory) / (1024 * 1024)
+        if duration >= profiler["min_seconds"] or memory_mb >= profiler["min_memory_mb"]:
+            _save_profile(profiler, org_name, profile, duration, memory_mb)
+
+def _save_profile(profiler, org_name, profile, duration, memory_mb):
+    file_name = re.sub(r'[\\/:*?"<>|\s]+', '_', org_name)
+    base_path = os.path.join(profiler["dir"], file_name)
+    try:
+        profile.dump_stats(f"{base_path}.prof")
+        report = io.StringIO()
+        report.write(f"{org_name} | 소요 시간 {duration:.2f}초 | 메모리 {memory_mb:.1f}MB\n\n")
+        stats = pstats.Stats(profile, stream=report)
+        stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        with open(f"{base_path}.txt", 'w', encoding='utf-8') as f:
+            f.write(report.getvalue())
+    except Exception as e:
+        profiler["logger"].error(f"[PROFILE] {org_name} 프로파일 저장 중 오류 발생: {e}")
+        return
+
+    for func, (_, _, own_time, _, _) in stats.stats.items():
+        profiler["hot"][func] = profiler["hot"].get(func, 0.0) + own_time
+    profiler["kept"].append((org_name, duration, memory_mb))
+    profiler["logger"].info(f"[PROFILE] {org_name} 프로파일 저장 ({duration:.2f}초, {memory_mb:.1f}MB)")
+
+def profile_summary(profiler, top=5):
+    """
+    저장된 프로파일들을 합산하여 자체 실행 시간 기준 상위 함수 요약을 반환합니다.
+
+    :return: 요약 문자열 리스트
+    """
+    if not profiler or not profiler["kept"]:
+        return []
+    lines = [f"프로파일 저장 기관 {len(profiler['kept'])}개: "
+             + ", ".join(f"{org}({duration:.0f}초)" for org, duration, _ in profiler["kept"])]
+    hot = sorted(profiler["hot"].items(), key=lambda pair: pair[1], reverse=True)[:top]
+    for (file_name, line, func), own_time in hot:
+        lines.append(f"{func} ({os.path.basename(file_name)}:{line}) {own_time:.2f}초")
+    return lines
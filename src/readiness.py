@@ -0,0 +1,93 @@
+import json
+import math
+import os
+
+READINESS_DIR = os.path.join("data", "cache")
+DEFAULT_TIMEOUT = 7         # 기록이 없는 기관의 최상위 문서 대기 시간(초)
+DEFAULT_FRAME_TIMEOUT = 3   # 기록이 없는 기관의 iframe별 대기 시간(초)
+MISS_GRACE = 3              # 요소를 찾은 적 없이 실패만 한 기관이 로드 완료 후 요소를 기다리는 시간(초)
+MIN_WAIT, MAX_WAIT = 2, 20  # 학습한 대기 시간의 범위
+FRAME_ONLY_TOP_WAIT = 1     # iframe 안에서만 요소가 나타나는 기관의 최상위 문서 대기 시간
+MAX_SAMPLES = 20            # 기관별로 보관하는 최근 등장 시간 수
+MISS_BACKOFF = 2            # 이 횟수만큼 연속 실패하면 학습한 등장 시간을 버리고 길게 대기 (사이트가 느려진 경우)
+MISS_PROBES = 3             # 길게 대기하는 실행 횟수, 이후에도 실패하면 요소가 없는 것으로 보고 일찍 포기
+
+def _readiness_path(config_key):
+    return os.path.join(READINESS_DIR, f"{config_key}_readiness.json")
+
+def load_readiness(config_key):
+    """
+    기관별 Selenium 요소 등장 기록을 불러옵니다.
+
+    :return: { org_name: {"appear": [최근 등장 시간(초), ...], "frame": iframe에서만 등장 여부, "misses": 연속 실패 횟수} }
+    """
+    path = _readiness_path(config_key)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_readiness(config_key, readiness, logger):
+    """
+    기관별 Selenium 요소 등장 기록을 저장합니다.
+    """
+    try:
+        os.makedirs(READINESS_DIR, exist_ok=True)
+        with open(_readiness_path(config_key), 'w', encoding='utf-8') as f:
+            json.dump(readiness, f, ensure_ascii=False, indent=4, sort_keys=True)
+    except Exception as e:
+        logger.error(f"[READINESS] 요소 등장 기록 저장 중 오류 발생: {e}")
+
+def wait_budget(stats):
+    """
+    기관의 과거 요소 등장 시간(p95)으로 대기 시간을 정합니다.
+    느리지만 정상인 페이지는 더 오래 기다리고, 빠른 페이지는 로드 완료 후 일찍 포기합니다.
+    iframe에서만 요소가 나타난 기관은 최상위 문서 대기를 짧게 줄입니다.
+    기록이 없는 기관은 기존 대기 시간을 그대로 사용합니다.
+    연속 실패로 등장 시간 기록이 지워진 기관은 MISS_PROBES회 동안 MAX_WAIT초까지 기다려 다시 학습하고,
+    그래도 찾지 못하면 로드 완료 후 MISS_GRACE초만 기다립니다.
+
+    :param stats: load_readiness의 기관별 기록 (없으면 None 또는 {})
+    :return: (최상위 문서 대기 시간, iframe별 대기 시간, 로드 완료 후 최소 대기 시간)
+    """
+    stats = stats or {}
+    samples = sorted(stats.get("appear") or [])
+    if not samples:
+        misses = stats.get("misses", 0)
+        if not misses:
+            return DEFAULT_TIMEOUT, DEFAULT_FRAME_TIMEOUT, DEFAULT_TIMEOUT
+        if MISS_BACKOFF <= misses < MISS_BACKOFF + MISS_PROBES:
+            return MAX_WAIT, DEFAULT_TIMEOUT, MAX_WAIT
+        return DEFAULT_TIMEOUT, DEFAULT_FRAME_TIMEOUT, MISS_GRACE
+
+    p95 = samples[math.ceil(0.95 * len(samples)) - 1]
+    budget = min(MAX_WAIT, max(MIN_WAIT, p95 * 1.5 + 1))
+    grace = min(budget, p95 + 1)
+    if stats.get("frame"):
+        return FRAME_ONLY_TOP_WAIT, budget, grace
+    return budget, DEFAULT_FRAME_TIMEOUT, grace
+
+def record_appearance(stats, seconds, in_frame):
+    """
+    요소가 나타나기까지 걸린 시간과 iframe 여부를 기록합니다. stats가 None이면 기록하지 않습니다.
+    """
+    if stats is None:
+        return
+    stats["appear"] = (stats.get("appear", []) + [round(seconds, 2)])[-MAX_SAMPLES:]
+    stats["frame"] = in_frame
+    stats["misses"] = 0
+
+def record_miss(stats):
+    """
+    요소를 끝내 찾지 못한 경우를 기록합니다. stats가 None이면 기록하지 않습니다.
+    MISS_BACKOFF회 연속 실패하면 예전 등장 시간과 iframe 여부는 더 이상 맞지 않는 것으로 보고 지웁니다.
+    """
+    if stats is None:
+        return
+    stats["misses"] = stats.get("misses", 0) + 1
+    if stats["misses"] >= MISS_BACKOFF:
+        stats.pop("appear", None)
+        stats.pop("frame", None)
@@ -0,0 +1,97 @@
+import json
+import os
+from statistics import median
+
+TIMINGS_DIR = os.path.join("data", "cache")
+DEFAULT_DURATION = 5.0      # 기록이 없는 기관의 예상 소요 시간(초)
+SLOW_THRESHOLD = 10.0       # 이 시간 이상 걸린 기관은 느린 lane으로 분류
+EWMA_ALPHA = 0.3            # 최근 실행 시간 반영 비율
+
+def _timings_path(config_key):
+    return os.path.join(TIMINGS_DIR, f"{config_key}_timings.json")
+
+def load_timings(config_key):
+    """
+    기관별 과거 소요 시간 기록을 불러옵니다.
+
+    :return: { org_name: {"duration": 초, "method": 성공한 방식 또는 "failed", "runs": 횟수} }
+    """
+    path = _timings_path(config_key)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_timings(config_key, timings, logger):
+    """
+    기관별 소요 시간 기록을 저장합니다.
+    """
+    try:
+        os.makedirs(TIMINGS_DIR, exist_ok=True)
+        with open(_timings_path(config_key), 'w', encoding='utf-8') as f:
+            json.dump(timings, f, ensure_ascii=False, indent=4, sort_keys=True)
+    except Exception as e:
+        logger.error(f"[SCHEDULE] 소요 시간 기록 저장 중 오류 발생: {e}")
+
+def record_timing(timings, org_name, duration, method):
+    """
+    이번 실행의 소요 시간을 지수 이동 평균으로 반영합니다.
+
+    :param method: 성공한 크롤링 방식, 실패했으면 None
+    """
+    previous = timings.get(org_name)
+    if previous:
+        duration = EWMA_ALPHA * duration + (1 - EWMA_ALPHA) * previous["duration"]
+    timings[org_name] = {
+        "duration": round(duration, 3),
+        "method": method or "failed",
+        "runs": (previous or {}).get("runs", 0) + 1,
+    }
+
+def is_slow(timing):
+    """
+    Selenium으로 성공했거나 모든 방식이 실패(= Selenium까지 시도)했거나,
+    SLOW_THRESHOLD 이상 걸린 기관을 느린(JS 의존) 기관으로 분류합니다.
+    """
+    if not timing:
+        return False
+    return (timing["method"].startswith("selenium") or timing["method"] == "failed"
+            or timing["duration"] >= SLOW_THRESHOLD)
+
+def plan_lanes(jobs, timings, fast_lanes=1):
+    """
+    작업을 예상 소요 시간 기준 LPT(longest-processing-time first)로 배치합니다.
+    느린 기관은 하나의 lane(WebDriver 1개)에, 빠른 기관은 fast_lanes개의 lane에 나눠 담고,
+    각 작업을 현재 부하가 가장 적은 lane에 긴 작업부터 배정합니다.
+    작업 하나에 여러 기관이 묶인 경우(같은 URL 그룹) 소요 시간을 합산하고, 한 기관이라도 느리면 느린 lane에 배정합니다.
+
+    :param jobs: [(org_names, job), ...] - org_names는 작업에 포함된 기관명 리스트
+    :param timings: load_timings가 반환한 기록
+    :param fast_lanes: 빠른 기관용 lane 수
+    :return: (lanes, 예상 makespan 초) - lanes는 [[job, ...], ...]
+    """
+    known = [timing["duration"] for timing in timings.values()]
+    default_duration = median(known) if known else DEFAULT_DURATION
+
+    def predict(org_names):
+        return sum(timings[name]["duration"] if name in timings else default_duration for name in org_names)
+
+    slow_lane, slow_load = [], 0.0
+    fast = [([], 0.0) for _ in range(max(1, fast_lanes))]
+    for org_names, job in sorted(jobs, key=lambda pair: predict(pair[0]), reverse=True):
+        duration = predict(org_names)
+        if any(is_slow(timings.get(name)) for name in org_names):
+            slow_lane.append(job)
+            slow_load += duration
+        else:
+            index = min(range(len(fast)), key=lambda i: fast[i][1])
+            lane, load = fast[index]
+            lane.append(job)
+            fast[index] = (lane, load + duration)
+
+    lanes = [lane for lane in [slow_lane] + [lane for lane, _ in fast] if lane]
+    makespan = max([slow_load] + [load for _, load in fast])
+    return lanes, makespan